@@ -40,6 +40,10 @@ __ALL__ = [
 _K = TypeVar("_K", bound=TKey)
 _V = TypeVar("_V", bound=TValue)
 
+# Prefixes of the placeholder keys that SDict._clean() checks for doublettes.
+# Note: str.startswith() accepts a tuple of prefixes and tests all of them in one single call.
+_PLACEHOLDER_PREFIXES: tuple[str, ...] = ("BLOCKCOMMENT", "INCLUDE", "LINECOMMENT")
+
 logger = logging.getLogger(__name__)
 
 
@@ -985,7 +989,7 @@ class SDict(dict[K, V]):
         includes_on_this_level: list[str] = []
         line_comments_on_this_level: list[str] = []
         for key in keys_on_this_level:
-            if type(key) is not str:
+            if not isinstance(key, str) or not key.startswith(_PLACEHOLDER_PREFIXES):
                 continue
             if re.search(pattern=r"BLOCKCOMMENT\d{6}", string=key):
                 block_comments_on_this_level.append(key)
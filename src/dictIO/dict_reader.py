@@ -276,11 +276,9 @@ class DictReader:
                 _refs = re.findall(pattern=r"\$\w[\w\[\]]*", string=expression)
                 for ref in _refs:
                     if ref in references_resolved:
-                        expression = re.sub(
-                            pattern=f"{re.escape(pattern=ref)}",
-                            repl=str(references_resolved[ref]),
-                            string=expression,
-                        )
+                        # Note: The reference is replaced as plain substring (no need to escape the '$').
+                        #       Also the resolved value is inserted as is, without processing backslash escapes.
+                        expression = expression.replace(ref, str(references_resolved[ref]))
 
                 eval_successful: bool = False
                 eval_result: V | None = None
@@ -3,9 +3,11 @@
 import logging
 import os
 import re
+import shutil
 from collections.abc import MutableMapping, MutableSequence
 from pathlib import Path
 from typing import Any, cast
+from uuid import uuid4
 
 from dictIO import Formatter, NativeParser, SDict, order_keys
 from dictIO.types import K, V
@@ -105,13 +107,22 @@ class DictWriter:
             else:
                 source_dict = order_keys(source_dict)
 
-        # Create formatted string
-        string = formatter.to_string(source_dict)
-
-        # Save formatted string to target_file
+        # Save formatted dict to target_file
+        # Note: The formatter writes into the file directly. Depending on the formatter,
+        #       this avoids building the complete formatted string in memory first (see JsonFormatter.to_stream()).
+        #       The formatter writes into a temporary file next to target_file, which replaces target_file only
+        #       once the dict has been written completely. Should formatting fail, target_file remains unchanged.
         target_file.parent.mkdir(parents=True, exist_ok=True)
-        with target_file.open(mode="w") as f:
-            _ = f.write(string)
+        _target_file = target_file.resolve()  # write through symlinks, instead of replacing them
+        temp_file = _target_file.with_name(f".{_target_file.name}.{uuid4().hex}.tmp")
+        try:
+            with temp_file.open(mode="x") as f:
+                formatter.to_stream(source_dict, f)
+            if _target_file.exists():
+                shutil.copymode(_target_file, temp_file)
+            _ = temp_file.replace(_target_file)
+        finally:
+            temp_file.unlink(missing_ok=True)
 
         return
 
@@ -2,16 +2,14 @@
 
 from __future__ import annotations
 
-import io
+import json
 import logging
 import re
 from collections.abc import Mapping, MutableMapping, MutableSequence
-from copy import copy, deepcopy
+from copy import copy
 from pathlib import Path
 from re import Pattern
-from typing import Any, cast, overload
-from xml.dom import minidom
-from xml.etree.ElementTree import Element, SubElement, register_namespace, tostring
+from typing import TYPE_CHECKING, Any, ClassVar, TextIO, cast, overload
 
 from numpy import ndarray
 
@@ -19,6 +17,9 @@ from dictIO import SDict
 from dictIO.types import K, M, S, TKey, TSingleValue, TValue, V
 from dictIO.utils.counter import BorgCounter
 
+if TYPE_CHECKING:
+    from xml.etree.ElementTree import Element
+
 __ALL__ = [
     "Formatter",
     "NativeFormatter",
@@ -30,6 +31,57 @@ __ALL__ = [
 
 logger = logging.getLogger(__name__)
 
+# Placeholder entries for block comments, include directives and line comments, as created in _parse_tokenized_dict()
+_PLACEHOLDER_PATTERN: Pattern[str] = re.compile(r"(BLOCKCOMMENT|INCLUDE|LINECOMMENT)(\d{6})\s+\1\2;")
+
+# Whitespace (except line endings) at the end of a line
+_TRAILING_SPACES_PATTERN: Pattern[str] = re.compile(r"[^\S\n]+$", re.MULTILINE)
+
+# Placeholder entries for include directives in a Json string, as created in _parse_tokenized_dict()
+_JSON_INCLUDE_PATTERN: Pattern[str] = re.compile(r'"INCLUDE(\d{6})"\s*:\s*"INCLUDE\1"')
+
+# Types of single values that are neither a list nor a dict (used for fast type checks in format_dict())
+_SINGLE_VALUE_TYPES: frozenset[type] = frozenset({str, int, float, bool, type(None)})
+
+# Placeholder keys of block comments and line comments (see XmlFormatter.populate_into_element())
+_XML_BLOCK_COMMENT_KEY_PATTERN: Pattern[str] = re.compile(r"BLOCKCOMMENT[0-9]+")
+_XML_LINE_COMMENT_KEY_PATTERN: Pattern[str] = re.compile(r"LINECOMMENT[0-9]+")
+
+# Strings that are a reference (e.g. '$name' or '$name[0]'), see Formatter.format_string()
+_REFERENCE_PATTERN: Pattern[str] = re.compile(r"^\$\w[\w\[\]]*$")
+
+# Strings that contain spaces or a path, see Formatter.format_string()
+_MULTI_WORD_PATTERN: Pattern[str] = re.compile(r"[\s:/\\]")
+
+# ' C++ ' marker, as contained in the first line of the default block comments (headers)
+_CPP_MARKER_PATTERN: Pattern[str] = re.compile(r"\s[Cc]\+{2}\s")
+
+# Default block comment (header) for files in dictIO native file format
+_DEFAULT_BLOCK_COMMENT_NATIVE: str = (
+    "/*---------------------------------*- C++ -*----------------------------------*\\\n"
+    "filetype dictionary; coding utf-8; version 0.1; local --; purpose --;\n"
+    "\\*----------------------------------------------------------------------------*/\n"
+)
+
+# Default block comment (header) for files in OpenFOAM dictionary format
+_DEFAULT_BLOCK_COMMENT_FOAM: str = (
+    "/*--------------------------------*- C++ -*----------------------------------*\\\n"
+    "| =========                 |                                                 |\n"
+    "| \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |\n"
+    "|  \\\\    /   O peration     | Version:  dev                                   |\n"
+    "|   \\\\  /    A nd           | Web:      www.OpenFOAM.com                      |\n"
+    "|    \\\\/     M anipulation  |                                                 |\n"
+    "\\*---------------------------------------------------------------------------*/\n"
+    "FoamFile\n"
+    "{\n"
+    "    version                   2.0;\n"
+    "    format                    ascii;\n"
+    "    class                     dictionary;\n"
+    "    object                    foamDict;\n"
+    "}\n"
+    "// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //\n"
+)
+
 
 class Formatter:
     """Abstract Base Class for formatters.
@@ -37,8 +89,28 @@ class Formatter:
     Formatters serialize a dict into a string applying a specific format.
     """
 
-    def __init__(self) -> None:
-        self.counter = BorgCounter()
+    # Names of the methods formatting a single value, by (exact) type of the value.
+    # NOTE: bool is a subtype of int. Dispatching on the exact type ensures that a bool is formatted as bool.
+    _format_methods: ClassVar[dict[type, str]] = {
+        str: "format_string",
+        bool: "format_bool",
+        int: "format_int",
+        float: "format_float",
+    }
+
+    @property
+    def counter(self) -> BorgCounter:
+        """Global counter for placeholder keys.
+
+        Formatters do not use the counter themselves. As the BorgCounter shares its state globally anyway,
+        a new BorgCounter instance gets returned only on request, instead of creating one with each Formatter.
+
+        Returns
+        -------
+        BorgCounter
+            the global counter
+        """
+        return BorgCounter()
 
     @classmethod
     def get_formatter(cls, target_file: Path | None = None) -> Formatter:
@@ -93,6 +165,25 @@ class Formatter:
         """
         return ""
 
+    def to_stream(
+        self,
+        arg: MutableMapping[K, V],
+        stream: TextIO,
+    ) -> None:
+        """Write a string representation of the passed in dict into a text stream.
+
+        Note: Formatters that can serialize directly into a stream (e.g. JsonFormatter) override this method.
+        The default implementation writes the string returned by to_string().
+
+        Parameters
+        ----------
+        arg : MutableMapping[K, V]
+            dict to be formatted
+        stream : TextIO
+            text stream (e.g. an open file) the formatted dict shall be written into
+        """
+        _ = stream.write(self.to_string(arg))
+
     @overload
     def format_value(
         self,
@@ -130,6 +221,16 @@ class Formatter:
         """
         # sourcery skip: assign-if-exp, reintroduce-else
 
+        # Fast path: Dispatch on the exact type of arg.
+        # (Resolving the method by name ensures that overrides in specific Formatters take effect.)
+        format_method_name = Formatter._format_methods.get(type(arg))
+        if format_method_name is not None:
+            return getattr(self, format_method_name)(arg)
+        if arg is None:
+            return self.format_none()
+
+        # Fallback: Subtypes of the single value types (e.g. numpy.float64, PosixPath)
+        # are not covered by the fast path and hence get resolved via `isinstance()`.
         # NOTE: The sequence of below `isinstance()` checks is important.
         #       Especially, `isinstance(arg, bool)` must be checked _before_ `isinstance(arg, int)`,
         #       as otherwise `isinstance(arg, int)` would catch the bool (bool is a subtype of int) !
@@ -143,8 +244,6 @@ class Formatter:
             return self.format_float(arg)
         if isinstance(arg, Path):
             return str(arg)
-        if arg is None:
-            return self.format_none()
 
         # For all other types, call and return `str(arg)`
         return str(arg)
@@ -307,16 +406,16 @@ class Formatter:
         str
             the formatted string
         """
-        if re.search(r"[$]", arg):
-            if re.search(r"^\$\w[\w\[\]]*$", arg):  # reference
+        if "$" in arg:
+            if _REFERENCE_PATTERN.search(arg):  # reference
                 return self.format_reference_string(arg)
             # expression
             return self.format_expression_string(arg)
         if not arg:  # empty string
             return self.format_empty_string(arg)
-        if re.search(r"[\"']", arg):  # contains a nested string
+        if '"' in arg or "'" in arg:  # contains a nested string
             return self.format_string_with_nested_string(arg)
-        if re.search(r"[\s:/\\]", arg):  # contains spaces or path -> complex string
+        if _MULTI_WORD_PATTERN.search(arg):  # contains spaces or path -> complex string
             return self.format_multi_word_string(arg)
         # single word string
         return self.format_single_word_string(arg)
@@ -488,28 +587,25 @@ class NativeFormatter(Formatter):
         str
             string representation of the dict in dictIO native file format
         """
-        # Create a working copy of the passed in dict, to avoid modifying the original.
-        _arg: MutableMapping[K, V] = deepcopy(arg)
-
-        # Sort dict in a way that block comment and include statement come first
-        original_data = deepcopy(_arg)
-        sorted_data: dict[K, V] = {}
-        for key, element in original_data.items():
-            if type(key) is str and re.search(r"BLOCKCOMMENT\d{6}", key):
-                sorted_data[cast(K, key)] = element
-        for key, element in original_data.items():
-            if type(key) is str and re.search(r"INCLUDE\d{6}", key):
-                sorted_data[cast(K, key)] = element
-        for key in sorted_data:
-            del original_data[key]
-        sorted_data |= original_data
-        _arg.clear()
-        _arg.update(sorted_data)
-
-        # Create the string representation of the dict in its basic structure.
-        s: str = self.format_dict(_arg)
-
-        if isinstance(_arg, SDict):
+        s: str
+        if isinstance(arg, SDict):
+            # Sort dict in a way that block comment and include statement come first.
+            # The sorted dict is a new dict which references the values of the original,
+            # so the passed in dict itself is not modified (and need not be copied).
+            sorted_data: dict[K, V] = {}
+            for key, element in arg.items():
+                if type(key) is str and key.startswith("BLOCKCOMMENT"):
+                    sorted_data[cast(K, key)] = element
+            for key, element in arg.items():
+                if type(key) is str and key.startswith("INCLUDE"):
+                    sorted_data[cast(K, key)] = element
+            for key, element in arg.items():
+                if key not in sorted_data:
+                    sorted_data[key] = element
+
+            # Create the string representation of the dict in its basic structure.
+            s = self.format_dict(sorted_data)
+
             # The following elements in an SDict
             # are usually still substituted by placeholders:
             # - Block comments
@@ -517,11 +613,15 @@ class NativeFormatter(Formatter):
             # - Line comments
             # Next step hence is to resolve and insert these three element types:
             # 1. Block comments
-            s = self.insert_block_comments(_arg, s)
+            s = self.insert_block_comments(arg, s)
             # 2. Include directives
-            s = self.insert_includes(_arg, s)
+            s = self.insert_includes(arg, s)
             # 3. Line comments
-            s = self.insert_line_comments(_arg, s)
+            s = self.insert_line_comments(arg, s)
+        else:
+            # A plain dict carries no placeholders for block comments or include directives,
+            # so it can be formatted as is.
+            s = self.format_dict(arg)
 
         # Remove trailing spaces (if any)
         s = self.remove_trailing_spaces(s)
@@ -540,18 +640,69 @@ class NativeFormatter(Formatter):
         ancestry: type[MutableMapping[Any, Any] | MutableSequence[Any]] = MutableMapping,
     ) -> str:
         """Format a dict or list object."""
+        # Dicts typically contain many repeated string values. Each distinct string value hence gets formatted
+        # only once per call of format_dict(). (The memo is local to each call, so it does not grow unbounded.)
+        formatted_strings: dict[str, str] = {}
+        parts: list[str] = []
+        self._format_dict(
+            arg=arg,
+            parts=parts,
+            formatted_strings=formatted_strings,
+            tab_len=tab_len,
+            level=level,
+            sep=sep,
+            items_per_line=items_per_line,
+            end=end,
+            ancestry=ancestry,
+        )
+        return "".join(parts)
+
+    def _format_dict(  # noqa: PLR0913, PLR0917
+        self,
+        arg: MutableMapping[Any, Any] | MutableSequence[Any] | Any,  # noqa: ANN401
+        parts: list[str],
+        formatted_strings: dict[str, str],
+        tab_len: int = 4,
+        level: int = 0,
+        sep: str = " ",
+        items_per_line: int = 10,
+        end: str = "\n",
+        ancestry: type[MutableMapping[Any, Any] | MutableSequence[Any]] = MutableMapping,
+    ) -> None:
+        """Format a dict or list object, appending the formatted lines to parts.
+
+        Nested dicts and lists are formatted by recursion, passing down the same parts list
+        and the same formatted_strings memo (formatted string values, by string value).
+        This way, the string representation gets joined only once, in format_dict(),
+        instead of once on each nesting level.
+        """
         total_indent = 30
-        s = ""
         indent = sep * tab_len * level
+        # Indentation of (nested) items one level below
+        sub_indent = sep * tab_len * (level + 1)
+        # Ints and floats get formatted inline with str() (saving two method calls per value),
+        # unless a specific Formatter overrides format_int() or format_float().
+        format_numbers_inline = (
+            type(self).format_int is Formatter.format_int and type(self).format_float is Formatter.format_float
+        )
 
         item: TValue
+        item_type: type
+
+        # Note: Concrete types are checked first (fast), before falling back to the (slower) isinstance checks
+        #       against the abstract base classes MutableSequence and MutableMapping.
+        arg_type = type(arg)
 
         # list
-        if isinstance(arg, MutableSequence):
+        if arg_type is list or (arg_type is not dict and isinstance(arg, MutableSequence)):
             # Opening bracket
-            s += self.format_dict("(", level=level, end=end)
+            parts.append(f"{indent}({end}")
 
             # List items
+            # Note: The first item on a line shall be indented by 1 relative to the (absolute) list level,
+            # each following item is then indented by 1 relative to its predecessor.
+            first_item_indent = sub_indent
+            following_item_indent = sep * tab_len
             first_item_on_this_line = True
             last_item_on_this_line = False
 
@@ -560,12 +711,15 @@ class NativeFormatter(Formatter):
                 # ndarray -> list
                 if isinstance(item, ndarray):
                     item = cast(list[TValue], item.tolist())
+                item_type = type(item)
 
                 # nested list
-                if isinstance(item, MutableSequence):
+                if item_type is list or (item_type not in _SINGLE_VALUE_TYPES and isinstance(item, MutableSequence)):
                     # recursion
-                    s += self.format_dict(
+                    self._format_dict(
                         arg=item,
+                        parts=parts,
+                        formatted_strings=formatted_strings,
                         tab_len=tab_len,
                         level=level + 1,
                         sep=sep,
@@ -575,11 +729,13 @@ class NativeFormatter(Formatter):
                     )
 
                 # nested dict
-                elif isinstance(item, MutableMapping):
-                    s += self.format_dict("", level=level + 1, end="\n")
-                    s += self.format_dict("{", level=level + 1)
-                    s += self.format_dict(
+                elif item_type is dict or (item_type not in _SINGLE_VALUE_TYPES and isinstance(item, MutableMapping)):
+                    parts.append(f"{sub_indent}\n")
+                    parts.append(f"{sub_indent}{{\n")
+                    self._format_dict(
                         arg=item,
+                        parts=parts,
+                        formatted_strings=formatted_strings,
                         tab_len=tab_len,
                         level=level + 2,
                         sep=sep,
@@ -587,59 +743,64 @@ class NativeFormatter(Formatter):
                         end=end,
                     )  # (recursion)
 
-                    s += self.format_dict("}", level=level + 1)
+                    parts.append(f"{sub_indent}}}\n")
                     first_item_on_this_line = True
 
                 # single value
                 else:
-                    value = self.format_value(item)
+                    if format_numbers_inline and item_type in (int, float):
+                        value = str(item)
+                    elif item_type is str:
+                        try:
+                            value = formatted_strings[cast(str, item)]
+                        except KeyError:
+                            value = formatted_strings[cast(str, item)] = self.format_value(item)
+                    else:
+                        value = self.format_value(item)
                     assert isinstance(value, str)
                     if first_item_on_this_line:
-                        # The first item shall be indented by 1 relative to the (absolute) list level
-                        item_level = level + 1
+                        item_indent = first_item_indent
                         first_item_on_this_line = False  # (effective with next item)
                     else:
-                        # each following item is then indented by 1 relative to its predecessor
-                        item_level = 1
+                        item_indent = following_item_indent
 
                     if ((index + 1) % items_per_line == 0) or (index + 1 == len(arg)):
                         last_item_on_this_line = True
 
                     if last_item_on_this_line:
                         # Add a line ending
-                        s += self.format_dict(value, level=item_level, end="\n")  # (recursion)
+                        parts.append(f"{item_indent}{value}\n")
                         last_item_on_this_line = False  # (effective with next item)
                         first_item_on_this_line = True  # (effective with next item)
                     else:
                         # Do not add a line ending. Instead, add an adjusted number of spaces
                         # after the item to make indentation look pretty.
-                        s += self.format_dict(
-                            f"{value}{sep * max(0, (14 - len(str(value))))}",
-                            level=item_level,
-                            end="",
-                        )  # (recursion)
+                        parts.append(f"{item_indent}{value}{sep * max(0, (14 - len(value)))}")
 
             # Closing bracket
             # if list (array) is complete, add semicolon
             if ancestry == MutableSequence:
-                s += self.format_dict(")", level=level, end=end)
+                parts.append(f"{indent}){end}")
             else:
-                s += self.format_dict(");", level=level, end=end)
+                parts.append(f"{indent});{end}")
 
         # dict
-        elif isinstance(arg, MutableMapping):
-            for key in arg:
-                item = arg[key]
+        elif arg_type is dict or isinstance(arg, MutableMapping):
+            # Width available for key and padding on this level
+            key_width = total_indent - tab_len * level
+            for key, _item in cast(MutableMapping[Any, Any], arg).items():
                 # ndarray -> list
-                if isinstance(item, ndarray):
-                    item = cast(list[TValue], item.tolist())
+                item = cast(list[TValue], _item.tolist()) if isinstance(_item, ndarray) else _item
+                item_type = type(item)
 
                 # nested dict
                 if isinstance(item, dict):
-                    s += self.format_dict(key, level=level)
-                    s += self.format_dict("{", level=level)
-                    s += self.format_dict(
+                    parts.append(f"{indent}{key}\n")
+                    parts.append(f"{indent}{{\n")
+                    self._format_dict(
                         item,
+                        parts=parts,
+                        formatted_strings=formatted_strings,
                         tab_len=tab_len,
                         level=level + 1,
                         sep=sep,
@@ -647,32 +808,38 @@ class NativeFormatter(Formatter):
                         end=end,
                     )  # (recursion)
 
-                    s += self.format_dict("}", level=level)
+                    parts.append(f"{indent}}}\n")
 
                 # nested list
                 elif isinstance(item, list):
-                    s += self.format_dict(key, level=level)
-                    s += self.format_dict(item, level=level)  # (recursion)
+                    parts.append(f"{indent}{key}\n")
+                    self._format_dict(
+                        item,
+                        parts=parts,
+                        formatted_strings=formatted_strings,
+                        level=level,
+                    )  # (recursion)
 
                 # key value pair
                 else:
-                    value = self.format_value(item)
+                    if format_numbers_inline and item_type in (int, float):
+                        value = str(item)
+                    elif item_type is str:
+                        try:
+                            value = formatted_strings[cast(str, item)]
+                        except KeyError:
+                            value = formatted_strings[cast(str, item)] = self.format_value(item)
+                    else:
+                        value = self.format_value(item)
                     assert isinstance(value, str)
                     skey: str = self.format_key(key)
-                    s += self.format_dict(
-                        f"{skey}{sep * max(8, (total_indent - len(skey) - tab_len * level))}{value};",
-                        level=level,
-                    )
+                    padding = sep * max(8, (key_width - len(skey)))
+                    parts.append(f"{indent}{skey}{padding}{value};\n")
 
         # Single item
-        # Note: This is the base case. It is reached only through recursion from
-        # dict -> key value pair    or from     list -> single value.
-        # arg will hence either be a single item from a list, or a key value pair from a dict.
+        # Note: This is the base case. It is reached only if format_dict() is called directly with a single item.
         else:
-            string = f"{indent}{arg}{end}"
-            s += string
-
-        return s
+            parts.append(f"{indent}{arg}{end}")
 
     def format_bool(self, arg: bool) -> str:  # noqa: FBT001
         """Format a boolean.
@@ -727,9 +894,9 @@ class NativeFormatter(Formatter):
         str
             the formatted string with a nested string
         """
-        if re.search(r'"', arg):
+        if '"' in arg:
             return self.add_single_quotes(arg)
-        if re.search(r"'", arg):
+        if "'" in arg:
             return self.add_double_quotes(arg)
         raise ValueError(f"expected a string with a nested string. However, following string was passed in: {arg}")
 
@@ -774,10 +941,18 @@ class NativeFormatter(Formatter):
         str s is expected to contain the SDict's block_content containing block comment placeholders
         to substitute (BLOCKCOMMENT... BLOCKCOMMENT...)
         """
-        # Replace all BLOCKCOMMENT placeholders in s with the actual block_comments saved in dict
+        # Keys of all BLOCKCOMMENT placeholders that exist in s
+        # (s need not be scanned at all if the SDict does not contain any block comments)
+        placeholder_keys: set[int] = (
+            {int(match[2]) for match in _PLACEHOLDER_PATTERN.finditer(s) if match[1] == "BLOCKCOMMENT"}
+            if s_dict.block_comments
+            else set()
+        )
+
+        # Resolve the actual block_comments saved in dict that shall replace the BLOCKCOMMENT placeholders in s
         block_comments_inserted_so_far = ""
         first_block_comment = True  # MonoFlop, armed
-        search_pattern: str | Pattern[str]
+        replacements: dict[str, str] = {}
         block_comment: str
         for key in s_dict.block_comments:
             block_comment = s_dict.block_comments[key]
@@ -789,20 +964,18 @@ class NativeFormatter(Formatter):
 
             # Check whether the current block comment is identical with a block comment that we already inserted earlier
             # (we do not want to insert any doubled block comments)
-            if re.search(re.escape(block_comment), block_comments_inserted_so_far):
+            if block_comment in block_comments_inserted_so_far:
                 block_comment = ""
 
-            # Search for the placeholder entry we created in _parse_tokenized_dict(),
-            # and insert back the original block_comment.
-            search_pattern = rf"BLOCKCOMMENT{key:06d}\s+BLOCKCOMMENT{key:06d};"
-            if (
-                len(re.findall(search_pattern, s)) > 0
-            ):  # if placeholders exist in s that match the key of the current block_comment
-                # Substitude the placehlder with the actual block_comment
-                s = re.sub(search_pattern, re.sub(r"\\", "\\\\\\\\", block_comment), s)  # no comment
+            # Only placeholders that exist in s get substituted
+            if key in placeholder_keys:
+                replacements[f"BLOCKCOMMENT{key:06d}"] = block_comment
                 # Document which block comments we already inserted.
                 block_comments_inserted_so_far += block_comment
 
+        # Substitute the placeholders we created in _parse_tokenized_dict() with the actual block_comments
+        s = self._substitute_placeholders(s, replacements)
+
         # If no block_comment had been inserted, insert the default block comment
         if block_comments_inserted_so_far == "":
             s = self.make_default_block_comment() + s
@@ -811,16 +984,12 @@ class NativeFormatter(Formatter):
 
     def make_default_block_comment(self, block_comment: str = "") -> str:
         """Create the default block comment (header) for files in dictIO native file format."""
+        if not block_comment:
+            return _DEFAULT_BLOCK_COMMENT_NATIVE
         # If there is no ' C++ ' contained in block_comment,
         # then insert the C++ default block comment in front:
-        # sourcery skip: move-assign
-        default_block_comment = (
-            "/*---------------------------------*- C++ -*----------------------------------*\\\n"
-            "filetype dictionary; coding utf-8; version 0.1; local --; purpose --;\n"
-            "\\*----------------------------------------------------------------------------*/\n"
-        )
-        if not re.search(r"\s[Cc]\+{2}\s", block_comment):
-            block_comment = default_block_comment + block_comment
+        if not _CPP_MARKER_PATTERN.search(block_comment):
+            block_comment = _DEFAULT_BLOCK_COMMENT_NATIVE + block_comment
         return block_comment
 
     def insert_includes(
@@ -829,17 +998,12 @@ class NativeFormatter(Formatter):
         s: str,
     ) -> str:
         """Insert back all include directives."""
-        search_pattern: str | Pattern[str]
-        for key, (_, include_file_name, _) in s_dict.includes.items():
-            # Search for the placeholder entry we created in _parse_tokenized_dict(),
-            # and insert back the original include directive.
-            _include_file_name = include_file_name.replace("\\", "\\\\")
-            _include_file_name = self.format_value(_include_file_name)
-            _include_directive = f"#include {_include_file_name}"
-            search_pattern = rf"INCLUDE{key:06d}\s+INCLUDE{key:06d};"
-            s = re.sub(search_pattern, _include_directive, s)
-
-        return s
+        # Substitute the placeholders we created in _parse_tokenized_dict() with the original include directives
+        replacements: dict[str, str] = {
+            f"INCLUDE{key:06d}": f"#include {self.format_value(include_file_name)}"
+            for key, (_, include_file_name, _) in s_dict.includes.items()
+        }
+        return self._substitute_placeholders(s, replacements)
 
     def insert_line_comments(
         self,
@@ -847,14 +1011,26 @@ class NativeFormatter(Formatter):
         s: str,
     ) -> str:
         """Insert back all line directives."""
-        search_pattern: str | Pattern[str]
-        for key, line_comment in s_dict.line_comments.items():
-            # Search for the placeholder entry we created in _parse_tokenized_dict(),
-            # and insert back the original block_comment.
-            search_pattern = rf"LINECOMMENT{key:06d}\s+LINECOMMENT{key:06d};"
-            s = re.sub(search_pattern, line_comment, s)
+        # Substitute the placeholders we created in _parse_tokenized_dict() with the original line comments
+        replacements: dict[str, str] = {
+            f"LINECOMMENT{key:06d}": line_comment for key, line_comment in s_dict.line_comments.items()
+        }
+        return self._substitute_placeholders(s, replacements)
+
+    @staticmethod
+    def _substitute_placeholders(
+        s: str,
+        replacements: Mapping[str, str],
+    ) -> str:
+        """Substitute BLOCKCOMMENT, INCLUDE and LINECOMMENT placeholders in s in one single pass.
 
-        return s
+        replacements maps the name of a placeholder (e.g. 'INCLUDE000001') to the string it shall be replaced with.
+        Placeholders not contained in replacements are left unchanged.
+        As the replacement strings are returned from a function, backslashes in them need no escaping.
+        """
+        if not replacements:
+            return s
+        return _PLACEHOLDER_PATTERN.sub(lambda match: replacements.get(match[1] + match[2], match[0]), s)
 
     def remove_trailing_spaces(self, s: str) -> str:
         """Remove trailing spaces from all lines.
@@ -862,17 +1038,9 @@ class NativeFormatter(Formatter):
         Reads all lines from the passed in string, removes trailing spaces from each line and
         returns a new string with trailing spaces removed.
         """
-        stream = io.StringIO(newline=None)
-        _ = stream.write(s)
-        _ = stream.seek(0)
-        ns = ""
-        for line in stream.readlines():
-            if match := re.search("[\r\n]*$", line):
-                line_ending = match[0]
-                line_without_ending = line[: len(line) - len(line_ending)]
-                line_without_trailingspaces = re.sub(r"\s+$", "", line_without_ending) + line_ending
-                ns += line_without_trailingspaces
-        return ns
+        # Normalize line endings to '\n' (universal newlines), then strip all lines in one pass.
+        s = s.replace("\r\n", "\n").replace("\r", "\n")
+        return _TRAILING_SPACES_PATTERN.sub("", s)
 
 
 class FoamFormatter(NativeFormatter):
@@ -903,20 +1071,20 @@ class FoamFormatter(NativeFormatter):
         # The dict content is hence reduced to what Foam is able to interpret.
         # Elements that Foam cannot interpret - or would misinterpret - are removed:
 
-        # Remove all dict entries starting with underscore
-        def remove_underscore_keys_recursive(
-            arg: MutableMapping[K, V],
-        ) -> None:
-            keys = list(arg.keys())
-            for key in keys:
-                if self.format_key(key).startswith("_"):
-                    del arg[key]
-                elif isinstance(arg[key], MutableMapping):
-                    remove_underscore_keys_recursive(arg[key])  # recursion
-            return
-
-        dict_adapted_for_foam = deepcopy(arg)
-        remove_underscore_keys_recursive(dict_adapted_for_foam)
+        # Remove all dict entries starting with underscore.
+        # Only the (nested) dicts get copied. Leaf values are not copied but re-referenced.
+        # Nested dicts are processed iteratively, by adding their (shallow) copies to a stack (instead of by recursion).
+        dict_adapted_for_foam = copy(arg)
+        dicts_to_adapt: list[MutableMapping[K, V]] = [dict_adapted_for_foam]
+        while dicts_to_adapt:
+            _arg = dicts_to_adapt.pop()
+            for key in list(_arg):  # work on a copy of keys
+                if isinstance(key, str) and key.startswith("_"):
+                    del _arg[key]
+                elif isinstance(item := _arg[key], MutableMapping):
+                    nested_dict = copy(cast(MutableMapping[K, V], item))
+                    _arg[key] = cast(V, nested_dict)
+                    dicts_to_adapt.append(nested_dict)
 
         # Call base class implementation (NativeFormatter)
         s = super().to_string(dict_adapted_for_foam)
@@ -954,10 +1122,10 @@ class FoamFormatter(NativeFormatter):
         str
             the formatted string with a nested string
         """
-        if re.search(r'"', arg):
-            _arg: str = re.sub(r'"', '\\"', arg)
+        if '"' in arg:
+            _arg: str = arg.replace('"', '\\"')
             return self.add_double_quotes(_arg)
-        if re.search(r"'", arg):
+        if "'" in arg:
             return self.add_double_quotes(arg)
         raise ValueError(f"expected a string with a nested string. However, following string was passed in: {arg}")
 
@@ -993,39 +1161,36 @@ class FoamFormatter(NativeFormatter):
 
     def make_default_block_comment(self, block_comment: str = "") -> str:
         """Create the default block comment (header) for files in OpenFOAM dictionary format."""
+        if not block_comment:
+            return _DEFAULT_BLOCK_COMMENT_FOAM
         # If there is no ' C++ ' and 'OpenFoam' contained in block_comment,
         # then insert the OpenFOAM default block comment in front:
-        default_block_comment = (
-            "/*--------------------------------*- C++ -*----------------------------------*\\\n"
-            "| =========                 |                                                 |\n"
-            "| \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |\n"
-            "|  \\\\    /   O peration     | Version:  dev                                   |\n"
-            "|   \\\\  /    A nd           | Web:      www.OpenFOAM.com                      |\n"
-            "|    \\\\/     M anipulation  |                                                 |\n"
-            "\\*---------------------------------------------------------------------------*/\n"
-            "FoamFile\n"
-            "{\n"
-            "    version                   2.0;\n"
-            "    format                    ascii;\n"
-            "    class                     dictionary;\n"
-            "    object                    foamDict;\n"
-            "}\n"
-            "// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //\n"
-        )
-        if not re.search(r"\s[Cc]\+{2}\s", block_comment):
-            block_comment = default_block_comment + block_comment
-        if not re.search(r"OpenFOAM", block_comment):
-            block_comment = default_block_comment
+        if not _CPP_MARKER_PATTERN.search(block_comment):
+            block_comment = _DEFAULT_BLOCK_COMMENT_FOAM + block_comment
+        if "OpenFOAM" not in block_comment:
+            block_comment = _DEFAULT_BLOCK_COMMENT_FOAM
         return block_comment
 
 
 class JsonFormatter(Formatter):
     """Formatter to serialize a dict into a string in JSON dictionary format."""
 
-    def __init__(self) -> None:
-        """Define default configuration for JsonFormatter."""
+    def __init__(
+        self,
+        *,
+        sort_keys: bool = False,
+    ) -> None:
+        """Define default configuration for JsonFormatter.
+
+        Parameters
+        ----------
+        sort_keys : bool, optional
+            whether keys shall be sorted in the Json string, by default False (keys keep their insertion order)
+        """
         # Invoke base class constructor
         super().__init__()
+        # Save default configuration as attributes
+        self.sort_keys: bool = sort_keys
 
     def to_string(
         self,
@@ -1043,40 +1208,69 @@ class JsonFormatter(Formatter):
         str
             string representation of the dict in JSON dictionary format
         """
-        import json
-
         # Json dump
-        s = json.dumps(
-            obj=arg,
-            skipkeys=True,
-            ensure_ascii=True,
-            check_circular=True,
-            allow_nan=True,
-            sort_keys=False,
-            indent=4,
-            separators=(",", ":"),
-        )
+        s = json.dumps(obj=arg, **self._json_options())
         if isinstance(arg, SDict):
             s = self.insert_includes(arg, s)
 
         return s
 
+    def to_stream(
+        self,
+        arg: MutableMapping[K, V],
+        stream: TextIO,
+    ) -> None:
+        """Write a string representation of the passed in dict in JSON dictionary format into a text stream.
+
+        The dict gets dumped directly into the stream, without building the complete Json string in memory first.
+        Only if the dict contains include directives, which need to be inserted back into the Json string,
+        the string gets built using to_string().
+
+        Parameters
+        ----------
+        arg : MutableMapping[K, V]
+            dict to be formatted
+        stream : TextIO
+            text stream (e.g. an open file) the formatted dict shall be written into
+        """
+        if isinstance(arg, SDict) and arg.includes:
+            _ = stream.write(self.to_string(arg))
+            return
+        # Json dump
+        json.dump(obj=arg, fp=stream, **self._json_options())
+
+    def _json_options(self) -> dict[str, Any]:
+        """Return the keyword arguments passed to json.dumps() and json.dump()."""
+        # Note: Sorting keys is optional, as it costs an extra sort of the keys of each (nested) dict.
+        #       The check for circular references is kept, so that a cyclic dict raises a ValueError
+        #       (instead of running into a RecursionError).
+        return {
+            "skipkeys": True,
+            "ensure_ascii": True,
+            "check_circular": True,
+            "allow_nan": True,
+            "sort_keys": self.sort_keys,
+            "indent": 4,
+            "separators": (",", ":"),
+        }
+
     def insert_includes(
         self,
         s_dict: SDict[K, V],
         s: str,
     ) -> str:
         """Insert back all include directives."""
-        search_pattern: str | Pattern[str]
+        include_directives: dict[str, str] = {}
         for key, (_, include_file_name, _) in s_dict.includes.items():
-            # Search for the placeholder key in the Json string,
-            # and insert back the original include directive.
-            _include_file_name = include_file_name.replace("\\", "\\\\\\\\")
-            _include_directive = f'"#include{key:06d}":"{_include_file_name}"'
-            search_pattern = rf'"INCLUDE{key:06d}"\s*:\s*"INCLUDE{key:06d}"'
-            s = re.sub(search_pattern, _include_directive, s)
-
-        return s
+            # Backslashes in the include file name need to be escaped in the Json string
+            _include_file_name = include_file_name.replace("\\", "\\\\")
+            include_directives[f"{key:06d}"] = f'"#include{key:06d}":"{_include_file_name}"'
+        if not include_directives:
+            return s
+        # Search for the placeholder keys in the Json string,
+        # and insert back the original include directives (in one single pass).
+        # Note: A function is used as replacement, so backslashes in the include directives are inserted as is.
+        return _JSON_INCLUDE_PATTERN.sub(lambda match: include_directives.get(match[1], match[0]), s)
 
 
 class XmlFormatter(Formatter):
@@ -1142,6 +1336,8 @@ class XmlFormatter(Formatter):
         self.omit_prefix: bool = omit_prefix
         self.integrate_attributes: bool = integrate_attributes
         self.remove_node_numbering: bool = remove_node_numbering
+        # Compiled patterns to remove namespace prefixes, by namespace prefixes
+        self._prefix_patterns: dict[tuple[str, ...], Pattern[str]] = {}
 
     def to_string(
         self,
@@ -1159,6 +1355,10 @@ class XmlFormatter(Formatter):
         str
             string representation of the dict in XML format
         """
+        # The xml modules are imported only when needed, i.e. when a dict actually gets formatted as XML.
+        from xml.dom import minidom
+        from xml.etree.ElementTree import Element, register_namespace, tostring
+
         # Default configuration
         namespaces: MutableMapping[str, str] = {"xs": "https://www.w3.org/2009/XMLSchema/XMLSchema.xsd"}
         root_tag: str = "NOTSPECIFIED"
@@ -1167,62 +1367,57 @@ class XmlFormatter(Formatter):
 
         # Check whether xml opts are contained in dict.
         # If so, read and use them
-        if "_xmlOpts" in arg:
-            xml_opts = cast(MutableMapping[K, V], arg[cast(K, "_xmlOpts")])
-            namespaces = (
-                cast(MutableMapping[str, str], xml_opts[cast(K, "_nameSpaces")])
-                if "_nameSpaces" in xml_opts
-                else namespaces
-            )
-            root_tag = str(xml_opts[cast(K, "_rootTag")]) if "_rootTag" in xml_opts else root_tag
-            root_attributes = (
-                cast(MutableMapping[str, str], xml_opts[cast(K, "_rootAttributes")])
-                if "_rootAttributes" in xml_opts
-                else root_attributes
-            )
-            self.remove_node_numbering = (
-                bool(xml_opts[cast(K, "_removeNodeNumbering")])
-                if "_removeNodeNumbering" in xml_opts
-                else self.remove_node_numbering
+        xml_opts = cast(MutableMapping[K, V] | None, arg.get(cast(K, "_xmlOpts")))
+        if xml_opts is not None:
+            namespaces = cast(MutableMapping[str, str], xml_opts.get(cast(K, "_nameSpaces"), namespaces))
+            root_tag = str(xml_opts.get(cast(K, "_rootTag"), root_tag))
+            root_attributes = cast(
+                MutableMapping[str, str] | None,
+                xml_opts.get(cast(K, "_rootAttributes"), root_attributes),
             )
+            self.remove_node_numbering = bool(xml_opts.get(cast(K, "_removeNodeNumbering"), self.remove_node_numbering))
 
-        prefixes: list[str] = []
-        prefix: str
-        uri: str
+        # Register the namespaces
+        # Note: Namespace registration is global to the process and can be changed by any other code in between.
+        #       Hence, the namespaces get registered anew with each call.
         for prefix, uri in namespaces.items():
-            prefixes.append(prefix)
-            if prefix == "None":
-                register_namespace("", uri)
-            else:
-                register_namespace(prefix, uri)
-        prefix = prefixes[0]
+            register_namespace("" if prefix == "None" else prefix, uri)
+        prefixes: tuple[str, ...] = tuple(namespaces)
 
         xsd_uri: str = namespaces[prefixes[0]]
 
         attributes: dict[str, str] = {}
         if root_attributes:
-            for key, item in root_attributes.items():
-                attributes[key] = item  # noqa: PERF403
+            if self.integrate_attributes:
+                # integrate attributes in root element (omitting attributes with empty string values)
+                attributes = {key: value for key, item in root_attributes.items() if (value := str(item))}
+            else:
+                attributes = dict(root_attributes)
 
-        # @TODO: Isn't it contradictory to first pass in here the attributes to root_element
-        #        but then thereafter ask whether to integrate the attributes?
         root_element = Element(f"{{{xsd_uri}}}{root_tag}", attrib=attributes)
-        if self.integrate_attributes:
-            # integrate attributes in root element
-            root_element.attrib = {k: str(v) for k, v in attributes.items() if str(v) != ""}
 
         self.populate_into_element(root_element, arg, xsd_uri)
 
+        # Note: The element tree is serialized to str (not to UTF-8 encoded bytes) before it gets pretty printed,
+        #       which spares minidom decoding the document again.
         s: str = minidom.parseString(  # noqa: S318
             tostring(
                 root_element,
-                encoding="UTF-8",
+                encoding="unicode",
                 method="xml",
             )
         ).toprettyxml(indent=indent)
         if self.omit_prefix:
-            query = f"({'|'.join(f'{s}:' for s in prefixes)})"
-            s = re.sub(query, "", s)
+            if len(prefixes) == 1:
+                # Single namespace (default): Remove the prefix as plain substring, without a regex.
+                s = s.replace(f"{prefixes[0]}:", "")
+            else:
+                # Compile the pattern only once per distinct set of namespace prefixes
+                prefix_pattern = self._prefix_patterns.get(prefixes)
+                if prefix_pattern is None:
+                    query = f"({'|'.join(f'{s}:' for s in prefixes)})"
+                    prefix_pattern = self._prefix_patterns[prefixes] = re.compile(query)
+                s = prefix_pattern.sub("", s)
 
         return s
 
@@ -1234,8 +1429,8 @@ class XmlFormatter(Formatter):
     ) -> None:
         """Populate arg into the XML element node.
 
-        If arg is a dict or list, method will call itself recursively until all nested content within the dict or list
-        is populated into nested elements, eventually creating an XML dom.
+        If arg is a dict or list, all nested content within the dict or list is populated into nested elements
+        (processing the nested elements one after another until none is left), eventually creating an XML dom.
 
         Parameters
         ----------
@@ -1250,72 +1445,91 @@ class XmlFormatter(Formatter):
 
         # @TODO: LINECOMMENTs not handled yet
 
-        if isinstance(arg, MutableSequence):
-            element.text = " ".join(str(x) for x in arg)
-
-        elif isinstance(arg, MutableMapping):
-            for key, item in arg.items():
-                skey: str = self.format_key(key)
-                if re.match(pattern="_content", string=skey):
-                    # Write back content (from the key-value pair "_content <content>;") into xml node.text
-                    # In case of multiline content, do not write it inline between opening and closing tag,
-                    # but add a line ending at the beginning and at the end, so that content gets formatted
-                    # as an indented text block beween the opening and closing tag.
-                    text = str(item)
-                    if text not in [None, ""] and len(text.splitlines()) > 1:
-                        text = "\n" + text + "\n"
-                    element.text = text
-
-                elif self.integrate_attributes and re.match(pattern="_attrib", string=skey):
-                    # attributes to integrate in node, otherwise leave in content
-                    # and remove attribs with empy strings
-                    # correct occurence of true false -> de-pythonize for lowercase
-                    # if here is more expense needed, we have to revoke the one-liner
-                    if isinstance(item, Mapping):
-                        attributes: dict[str, str] = {
-                            k: str(v).lower()
-                            if re.match(pattern="^(true|false)$", string=str(v), flags=re.IGNORECASE)
-                            else str(v)
-                            for k, v in item.items()
-                            if str(v) != ""
-                        }
-                        element.attrib = attributes
-
-                elif re.match(pattern="^(_.*[Oo]pts|INCLUDE)", string=skey):
-                    # undescore elements _opts _xmlOpts and INCLUDE are considered not being content so far
-                    pass
-
-                elif re.match(pattern="BLOCKCOMMENT[0-9]+", string=skey):
-                    if re.search(pattern=".*0$", string=skey):
-                        # take all except the first one as this is /* C++ dict */
-                        pass
-                    else:
-                        # @TODO: Implement substitution of BLOCKCOMMENT
-                        # cIndex = int(re.findall('(?<=BLOCKCOMMENT)[0-9]+', skey)[0])  # noqa: ERA001
-                        # element.append(Comment(item))  # noqa: ERA001
+        from xml.etree.ElementTree import SubElement
+
+        # Namespace part of the tags of all child nodes, in Clark notation ({uri}tag)
+        namespace_part = f"{{{xsd_uri}}}"
+        # Configuration does not change while populating, hence it is read only once
+        integrate_attributes = self.integrate_attributes
+        remove_node_numbering = self.remove_node_numbering
+
+        # Elements still to be populated, together with the value to be populated into them.
+        # Nested dicts are processed iteratively, by adding their child nodes to this stack (instead of by recursion).
+        # Note: The order in which the elements get populated does not matter, as each child node gets created
+        #       (and hence positioned inside its parent element) already when its parent element gets populated.
+        elements_to_populate: list[tuple[Element, Any]] = [(element, arg)]
+        while elements_to_populate:
+            element, arg = elements_to_populate.pop()
+            if isinstance(arg, MutableSequence):
+                element.text = " ".join(str(x) for x in arg)
+
+            elif isinstance(arg, MutableMapping):
+                for key, item in arg.items():
+                    skey: str = self.format_key(key)
+                    if skey.startswith("_content"):
+                        # Write back content (from the key-value pair "_content <content>;") into xml node.text
+                        # In case of multiline content, do not write it inline between opening and closing tag,
+                        # but add a line ending at the beginning and at the end, so that content gets formatted
+                        # as an indented text block beween the opening and closing tag.
+                        text = str(item)
+                        # Note: Only text containing a '\n' is considered multiline content. Hence, single line text
+                        #       (the common case) needs not to be split into its lines.
+                        if "\n" in text and len(text.splitlines()) > 1:
+                            text = "\n" + text + "\n"
+                        element.text = text
+
+                    elif integrate_attributes and skey.startswith("_attrib"):
+                        # attributes to integrate in node, otherwise leave in content
+                        # and remove attribs with empy strings
+                        # correct occurence of true false -> de-pythonize for lowercase
+                        if isinstance(item, Mapping):
+                            attributes: dict[str, str] = {}
+                            for k, v in item.items():
+                                value = str(v)
+                                if not value:
+                                    continue
+                                value_lowercase = value.lower()
+                                attributes[k] = value_lowercase if value_lowercase in ("true", "false") else value
+                            element.attrib = attributes
+
+                    elif skey.startswith("INCLUDE") or (skey.startswith("_") and ("Opts" in skey or "opts" in skey)):
+                        # undescore elements _opts _xmlOpts and INCLUDE are considered not being content so far
                         pass
 
-                elif re.match(pattern="LINECOMMENT[0-9]+", string=skey):
-                    # @TODO: Implement substitution of LINECOMMENT
-                    # cIndex = int(re.findall('(?<=LINECOMMENT)[0-9;]+', skey)[0])  # noqa: ERA001
-                    # root_element.append(Comment(re.sub('/', '', self.dict.line_comments[cIndex])))  # noqa: ERA001
-                    pass
-
-                else:
-                    # nested content
-                    _skey = skey
-                    _item = item
-                    if self.remove_node_numbering:
-                        _skey = re.sub(pattern=r"(^\d{1,6}_)", repl="", string=_skey)
-
-                    # Substitute with empty string to force <NODE/> in favour of <NODE>None</NODE>
-                    if _item is None:
-                        _item = ""
+                    elif skey.startswith("BLOCKCOMMENT") and _XML_BLOCK_COMMENT_KEY_PATTERN.match(skey):
+                        if skey.endswith("0"):
+                            # take all except the first one as this is /* C++ dict */
+                            pass
+                        else:
+                            # @TODO: Implement substitution of BLOCKCOMMENT
+                            # cIndex = int(re.findall('(?<=BLOCKCOMMENT)[0-9]+', skey)[0])  # noqa: ERA001
+                            # element.append(Comment(item))  # noqa: ERA001
+                            pass
+
+                    elif skey.startswith("LINECOMMENT") and _XML_LINE_COMMENT_KEY_PATTERN.match(skey):
+                        # @TODO: Implement substitution of LINECOMMENT
+                        # cIndex = int(re.findall('(?<=LINECOMMENT)[0-9;]+', skey)[0])  # noqa: ERA001
+                        # root_element.append(Comment(re.sub('/', '', self.dict.line_comments[cIndex])))  # noqa: ERA001
+                        pass
 
-                    child_node = SubElement(element, f"{{{xsd_uri}}}{_skey}")
-                    self.populate_into_element(element=child_node, arg=_item, xsd_uri=xsd_uri)
+                    else:
+                        # nested content
+                        _skey = skey
+                        _item = item
+                        if remove_node_numbering:
+                            # Remove the node numbering prefix (1 to 6 digits, followed by an underscore), if any
+                            numbering, underscore, key_without_numbering = _skey.partition("_")
+                            if underscore and len(numbering) <= 6 and numbering.isdecimal():  # noqa: PLR2004
+                                _skey = key_without_numbering
+
+                        # Substitute with empty string to force <NODE/> in favour of <NODE>None</NODE>
+                        if _item is None:
+                            _item = ""
+
+                        child_node = SubElement(element, namespace_part + _skey)
+                        elements_to_populate.append((child_node, _item))
 
-        else:
-            element.text = str(arg)
+            else:
+                element.text = str(arg)
 
         return
@@ -5,7 +5,10 @@ from __future__ import annotations
 
 import logging
 import re
-from collections.abc import MutableMapping, MutableSequence, Sequence
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable, MutableMapping, MutableSequence, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from re import Match, Pattern
 from typing import (
@@ -28,6 +31,89 @@ __ALL__ = ["Parser", "NativeParser", "FoamParser", "JsonParser", "XmlParser"]
 
 logger = logging.getLogger(__name__)
 
+# Lines containing '//': Content before the FIRST '//', and line comment from there until the line ending,
+# see NativeParser._extract_line_comments()
+_LINE_COMMENT_PATTERN: Pattern[str] = re.compile(
+    r"^(?P<content>(?:(?!//)[^\n])*)(?P<line_comment>//[^\n]*)",
+    re.MULTILINE,
+)
+# '//' starting a C++ line comment (i.e. not just the '//' in 'http://')
+_LINE_COMMENT_START_PATTERN: Pattern[str] = re.compile(r"(?<!:)/{2}")
+
+# Lines containing an include directive, see NativeParser._extract_includes()
+_INCLUDE_PATTERN: Pattern[str] = re.compile(r"^[^\S\n]*#[^\S\n]*include[^\n]*", re.MULTILINE)
+# Include directive and trailing whitespace, to be removed in order to extract the include file name
+_INCLUDE_DIRECTIVE_PATTERN: Pattern[str] = re.compile(r"(^\s*#\s*include\s*|\s*$)")
+
+# C++ block comments (/* .. */), see NativeParser._extract_block_comments()
+_BLOCK_COMMENT_PATTERN: Pattern[str] = re.compile(r"/\*.*?\*/", re.DOTALL)
+
+# Single and double quoted string literals, see NativeParser._extract_string_literals()
+_SINGLE_QUOTED_STRING_LITERAL_PATTERN: Pattern[str] = re.compile(
+    pattern=r"(?P<sq>((?<!\\)\\{8}')|((?<!\\)\\{6}')|((?<!\\)\\{4}')|((?<!\\)\\{2}')|(?<!\\)').*?(?P=sq)",
+    flags=re.MULTILINE,
+)
+_DOUBLE_QUOTED_STRING_LITERAL_PATTERN: Pattern[str] = re.compile(
+    pattern=r'(?P<dq>((?<!\\)\\{8}")|((?<!\\)\\{6}")|((?<!\\)\\{4}")|((?<!\\)\\{2}")|(?<!\\)").*?(?P=dq)',
+)
+
+# String literal placeholders, see NativeParser._insert_string_literals()
+_STRING_LITERAL_PLACEHOLDER_PATTERN: Pattern[str] = re.compile(r"STRINGLITERAL\d{6}")
+
+# Expressions (double quoted strings containing minimum one reference), see NativeParser._extract_expressions()
+_EXPRESSION_PATTERN: Pattern[str] = re.compile(r'"[^"]*\$.*?"', re.MULTILINE)
+# References to key'd entries, denoted using the '$' syntax
+_REFERENCE_PATTERN: Pattern[str] = re.compile(r"\$\w[\w\[\]]*", re.MULTILINE)
+# A single plain reference, optionally surrounded by whitespace, see JsonParser._extract_expression()
+_SINGLE_REFERENCE_PATTERN: Pattern[str] = re.compile(r"^\s*(\$\w[\w\[\]]*){1}\s*$", re.MULTILINE)
+
+# Whitespace, see NativeParser._separate_delimiters()
+_WHITESPACES_PATTERN: Pattern[str] = re.compile(r"\s+")
+
+# Keys holding an include directive, see JsonParser._extract_includes()
+_INCLUDE_KEY_PATTERN: Pattern[str] = re.compile(r"^\s*#\s*include")
+
+# XML namespace prefix of a tag, node numbering prefix, and empty node text, see XmlParser
+_XML_NAMESPACE_PATTERN: Pattern[str] = re.compile(r"\{.*\}")
+_XML_LEADING_NAMESPACE_PATTERN: Pattern[str] = re.compile(r"^(\{.*\})")
+_XML_NODE_NUMBERING_PATTERN: Pattern[str] = re.compile(r"^\d{6}_")
+_XML_EMPTY_TEXT_PATTERN: Pattern[str] = re.compile(r"^[\s\n\r]*$")
+
+# Leading and trailing quotes (and backslashes), see Parser.remove_quotes_from_string()
+_LEADING_AND_TRAILING_QUOTE_PATTERN: Pattern[str] = re.compile(r'(^[\'\\"]{1}|[\'\\"]{1}$)')
+_QUOTE_CHARACTERS: frozenset[str] = frozenset("'\\\"")
+
+# Types of nested containers (dicts and lists), see Parser.parse_values()
+_CONTAINER_TYPES: tuple[type[MutableMapping[Any, Any]], type[MutableSequence[Any]]] = (MutableMapping, MutableSequence)
+
+# Simple placeholders or reserved expressions, which Parser.parse_value() returns as is
+_RESERVED_VALUES: frozenset[str] = frozenset({"-", "_", "."})
+
+# Characters a string that represents a number (int or float) can start and end with, see Parser.parse_value()
+# Note: Checking first and last character excludes strings that int() and float() would accept as well,
+#       but which are not meant to be numbers (e.g. 'inf', '-nan' or strings with leading or trailing spaces).
+_NUMBER_FIRST_CHARACTERS: frozenset[str] = frozenset("+-.0123456789")
+_NUMBER_LAST_CHARACTERS: frozenset[str] = frozenset(".0123456789")
+
+# Booleans and None types that are masked as (lowercase) strings, see Parser.parse_value()
+_MASKED_SINGLE_VALUES: dict[str, bool | None] = {
+    "true": True,
+    "false": False,
+    "on": True,  # OpenFOAM
+    "off": False,  # OpenFOAM
+    "none": None,
+    "null": None,  # C++ 'NULL' or JSON 'null'
+}
+
+
+def _read_source_file(source_file: Path) -> str:
+    """Read the content of a source file, raising FileNotFoundError if it does not exist."""
+    if not source_file.exists():
+        logger.error(f"source_file not found: {source_file}")
+        raise FileNotFoundError(source_file)
+    # Note: Existence of the file has been checked already above. It does not need to be checked again.
+    return source_file.read_text()
+
 
 class Parser:
     """Base Class for parsers.
@@ -102,21 +188,78 @@ class Parser:
         """
         # Make sure source_file argument is of type Path. If not, cast it to Path type.
         source_file = source_file if isinstance(source_file, Path) else Path(source_file)
-        if not source_file.exists():
-            logger.error(f"source_file not found: {source_file}")
-            raise FileNotFoundError(source_file)
 
-        self.source_file = source_file
+        # Read file content
+        file_content = _read_source_file(source_file)
+
+        return self._parse_file_content(
+            source_file=source_file,
+            file_content=file_content,
+            target_dict=target_dict,
+            comments=comments,
+        )
+
+    def parse_files(
+        self,
+        source_files: Iterable[str | os.PathLike[str]],
+        *,
+        comments: bool = True,
+        max_workers: int | None = None,
+    ) -> list[SDict[Any, Any]]:
+        """Parse multiple files and deserialize each of them into a dict.
+
+        The files are read concurrently in a thread pool, so that the (GIL releasing) file I/O of
+        the individual files can overlap. Parsing the file contents then happens sequentially.
+
+        Parameters
+        ----------
+        source_files : Iterable[Union[str, os.PathLike[str]]]
+            names of the dict files to be parsed
+        comments : bool, optional
+            reads comments from source files, by default True
+        max_workers : int, optional
+            maximum number of threads used to read the files, by default None (ThreadPoolExecutor default)
+
+        Returns
+        -------
+        list[SDict[Any, Any]]
+            the parsed dicts, in the same order as source_files
 
-        # Check whether file to read from exists.
-        if not self.source_file.exists():
-            logger.warning(
-                f"Parser.parse_file(): File or path does not exist: '{source_file}'. Empty dict will be returned."
+        Raises
+        ------
+        FileNotFoundError
+            if any of the source files does not exist
+        """
+        # Make sure all source_file arguments are of type Path. If not, cast them to Path type.
+        _source_files: list[Path] = [
+            source_file if isinstance(source_file, Path) else Path(source_file) for source_file in source_files
+        ]
+
+        # Read file contents concurrently
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            file_contents: list[str] = list(executor.map(_read_source_file, _source_files))
+
+        # Parse file contents sequentially
+        return [
+            self._parse_file_content(
+                source_file=source_file,
+                file_content=file_content,
+                target_dict=None,
+                comments=comments,
             )
-            file_content = ""
-        else:
-            with self.source_file.open("r") as f:
-                file_content = f.read()
+            for source_file, file_content in zip(_source_files, file_contents, strict=True)
+        ]
+
+    def _parse_file_content(
+        self,
+        source_file: Path,
+        file_content: str,
+        target_dict: SDict[K, V] | None,
+        *,
+        comments: bool,
+    ) -> SDict[K, V]:
+        """Parse the content of a file that has already been read, and deserialize it into a dict."""
+        self.source_file = source_file
 
         # Create target dict in case no specific target dict was passed in
         if target_dict is None:
@@ -124,10 +267,6 @@ class Parser:
         else:
             target_dict.source_file = source_file.absolute()
 
-        # one final check that the source file exists
-        if not self.source_file.exists():
-            logger.error(f"Parser.parse_file(): Source file does not exist ('{source_file}').")
-
         # Parse file content
         parsed_dict = self.parse_string(
             string=file_content,
@@ -203,20 +342,10 @@ class Parser:
         TSingleValue
             the value casted to its native type (TSingleValue = str | int | float | bool | None)
         """
-        # Numbers (int and float) are returned without conversion
-        if isinstance(arg, int) and not isinstance(arg, bool):  # int
-            return arg
-        if isinstance(arg, float):  # float
-            return arg
-
-        # Boolean and None types are returned without conversion
-        if isinstance(arg, bool):  # bool
-            return arg
-        if arg is None:  # None
-            return arg
-
-        # Any other non-string type: Return without conversion
-        if not isinstance(arg, str):
+        # Numbers (int and float), Boolean and None types, as well as any other non-string type,
+        # are returned without conversion.
+        # Note: Most values passed in are strings. Checking the exact type first spares the isinstance() check.
+        if type(arg) is not str and not isinstance(arg, str):
             return arg
 
         # String: Convert the string content to its native type, where possible.
@@ -231,43 +360,39 @@ class Parser:
         # Simple placeholder or reserved expressions -> do nothing
         # Note: This if clause is important: It avoids that distinct placeholders like e.g.
         # '-' are interpreted as float (and then transformed to float .. what might even fail).
-        if arg in ["-", "_", "."]:
+        if arg in _RESERVED_VALUES:
             return arg
 
         # String numbers shall be converted to numbers (int and float)
-        if re.search(r"^[+-]?\d+$", arg):  # int
-            return int(arg)
-        if re.search(r"^[+-]?(\d+(\.\d*)?|\.\d+)$", arg):  # float
-            return float(arg)
-        if re.search(r"^[+-]?\d*(\.\d*)?([eE]?[-+]?\d+)?$", arg):  # float written as fpn like 1.e-03
-            return float(arg)
+        # Note: int() and float() are tried directly. Strings that are not a number get rejected by a ValueError.
+        #       Underscores, though accepted by int() and float() as digit separators, are not valid in dict files.
+        if arg[0] in _NUMBER_FIRST_CHARACTERS and arg[-1] in _NUMBER_LAST_CHARACTERS and "_" not in arg:
+            try:
+                return int(arg)
+            except ValueError:
+                pass
+            try:
+                return float(arg)  # also floats written as fpn like 1.e-03
+            except ValueError:
+                pass
 
         # Booleans and None types that are masked as strings
         # ('True', 'true', 'False', 'false', 'ON', 'on', 'OFF', 'off', 'None', 'none', 'NULL', 'null')  # noqa: ERA001
         # shall be converted to its native Boolean or None type, respectively
-        if re.search(r"^(true)$", arg.strip().lower()):  # True
-            return True
-        if re.search(r"^(false)$", arg.strip().lower()):  # False
-            return False
-        if re.search(r"^(on)$", arg.strip().lower()):  # OpenFOAM 'on' -> True
-            return True
-        if re.search(r"^(off)$", arg.strip().lower()):  # OpenFOAM 'off' -> False
-            return False
-        if re.search(r"^(none)$", arg.strip().lower()):  # None
-            return None
-        if re.search(r"^(null)$", arg.strip().lower()):  # C++ 'NULL' or JSON 'null' -> None
-            return None
+        arg_lowercase: str = arg.strip().lower()
+        if arg_lowercase in _MASKED_SINGLE_VALUES:
+            return _MASKED_SINGLE_VALUES[arg_lowercase]
 
         # Any other string: return 'as is', but make sure extra quotes, if so, are stripped.
         # Note: Also any placeholder strings will fall into this category.
         # Returned 'as is' they are kept unchanged, what is in fact what we want here.
-        return self.remove_quotes_from_string(arg)
+        return check
 
     def parse_values(self, arg: MutableMapping[K, V] | MutableSequence[V]) -> None:
         """Parse multiple values.
 
         Parses all values inside a dict or list and casts them to its native types (str, int, float, bool or None).
-        The function traverses the passed in dict or list recursively
+        The function traverses the passed in dict or list
         so that all values in also nested dicts and lists are parsed.
 
         Parameters
@@ -277,18 +402,24 @@ class Parser:
             (str, int, float, bool or None)
 
         """
-        if isinstance(arg, MutableMapping):  # Dict
-            for key in list(arg.keys()):  # work on a copy of keys
-                if isinstance(arg[key], MutableMapping | MutableSequence):
-                    self.parse_values(cast(MutableMapping[K, V] | MutableSequence[V], arg[key]))
-                else:
-                    arg[key] = cast(V, self.parse_value(arg[key]))
-        else:  # List
-            for index in range(len(arg)):
-                if isinstance(arg[index], MutableMapping | MutableSequence):
-                    self.parse_values(cast(MutableMapping[K, V] | MutableSequence[V], arg[index]))
-                else:
-                    arg[index] = cast(V, self.parse_value(arg[index]))
+        # Dicts and lists still to be parsed.
+        # Nested dicts and lists are processed iteratively, by adding them to this stack (instead of by recursion).
+        containers_to_parse: list[MutableMapping[K, V] | MutableSequence[V]] = [arg]
+        while containers_to_parse:
+            container = containers_to_parse.pop()
+            if isinstance(container, MutableMapping):  # Dict
+                # Note: Only values get replaced, no keys are added or removed. Hence, items() can be iterated directly.
+                for key, item in container.items():
+                    if isinstance(item, _CONTAINER_TYPES):
+                        containers_to_parse.append(item)
+                    else:
+                        container[key] = cast(V, self.parse_value(item))
+            else:  # List
+                for index, item in enumerate(container):
+                    if isinstance(item, _CONTAINER_TYPES):
+                        containers_to_parse.append(item)
+                    else:
+                        container[index] = cast(V, self.parse_value(item))
         return
 
     def parse_key(
@@ -337,16 +468,18 @@ class Parser:
         str
             the string with quotes being removed
         """
-        search_pattern: Pattern[str]
-        if all_quotes:  # noqa: SIM108
+        if all_quotes:
             # Removes ALL quotes in a string:
             # Not only leading and trailing quotes, but also quotes inside a string are removed.
-            search_pattern = re.compile(r"[\'\"]")
-        else:
-            # Removes only leading and trailing quotes. Quotes inside a string are kept.
-            search_pattern = re.compile(r'(^[\'\\"]{1}|[\'\\"]{1}$)')
+            return arg.replace("'", "").replace('"', "")
 
-        return re.sub(search_pattern, "", arg)
+        # Removes only leading and trailing quotes. Quotes inside a string are kept.
+        # Strings that neither start nor end with a quote are returned right away, without running the regex.
+        # (A trailing line ending needs the regex though, as the quote could be right before it.)
+        last_character = arg[-1:]
+        if arg[:1] not in _QUOTE_CHARACTERS and last_character not in _QUOTE_CHARACTERS and last_character != "\n":
+            return arg
+        return _LEADING_AND_TRAILING_QUOTE_PATTERN.sub("", arg)
 
     @staticmethod
     def remove_quotes_from_strings(
@@ -355,7 +488,7 @@ class Parser:
         """Remove quotes from multiple strings.
 
         Removes quotes (single and double quotes) from all string objects inside a dict or list.
-        The function traverses the passed in dict or list recursively
+        The function traverses the passed in dict or list
         so that all strings in also nested dicts and lists are processed.
 
 
@@ -370,20 +503,25 @@ class Parser:
             the original dict or list, yet with quotes in all strings being removed
 
         """
-        if isinstance(arg, MutableMapping):  # Dict
-            arg = cast(M, arg)
-            for key in list(arg.keys()):  # work on a copy of keys
-                if isinstance(arg[key], MutableMapping | MutableSequence):  # dict or list
-                    arg[key] = Parser.remove_quotes_from_strings(arg[key])  # (recursion)
-                elif isinstance(arg[key], str):  # str
-                    arg[key] = Parser.remove_quotes_from_string(arg[key])
-        else:  # List
-            arg = cast(S, arg)
-            for index in range(len(arg)):
-                if isinstance(arg[index], MutableMapping | MutableSequence):  # dict or list
-                    arg[index] = Parser.remove_quotes_from_strings(arg[index])  # (recursion)
-                elif isinstance(arg[index], str):  # str
-                    arg[index] = Parser.remove_quotes_from_string(arg[index])
+        # Dicts and lists still to be processed.
+        # Nested dicts and lists are processed iteratively, by adding them to this stack (instead of by recursion).
+        containers_to_process: list[M | S] = [arg]
+        while containers_to_process:
+            container = containers_to_process.pop()
+            if isinstance(container, MutableMapping):  # Dict
+                container = cast(M, container)
+                for key, item in container.items():
+                    if isinstance(item, _CONTAINER_TYPES):  # dict or list
+                        containers_to_process.append(item)
+                    elif isinstance(item, str):  # str
+                        container[key] = Parser.remove_quotes_from_string(item)
+            else:  # List
+                container = cast(S, container)
+                for index, item in enumerate(container):
+                    if isinstance(item, _CONTAINER_TYPES):  # dict or list
+                        containers_to_process.append(item)
+                    elif isinstance(item, str):  # str
+                        container[index] = Parser.remove_quotes_from_string(item)
 
         return arg
 
@@ -424,8 +562,10 @@ class NativeParser(Parser):
 
         # +++PARSE LINE CONTENT+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
-        # Split file content into lines and store them in the newly created SDict instance
-        parsed_dict.line_content = string.splitlines(keepends=True)
+        # Store file content as one text block in the newly created SDict instance
+        # Line comments, include directives and block comments are extracted from the text block directly.
+        # As these are delimited by line endings, at first we preserve them.
+        parsed_dict.block_content = string  # preserves line endings
 
         # Extract line comments
         self._extract_line_comments(
@@ -438,10 +578,6 @@ class NativeParser(Parser):
 
         # +++PARSE BLOCK CONTENT++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
-        # Concatenate all lines from line_content
-        # As extracting block comments is easier with line endings still existing, at first we preserve them.
-        self._convert_line_content_to_block_content(parsed_dict)  # preserves line endings
-
         # Extract block comments      ..and remove line endings right thereafter
 
         self._extract_block_comments(
@@ -490,35 +626,37 @@ class NativeParser(Parser):
         *,
         comments: bool,
     ) -> None:
-        """Find and extract C++ line comments (// ..) from dict.line_content, and replace them with Placeholders.
+        """Find and extract C++ line comments (// ..) from dict.block_content, and replace them with Placeholders.
 
         Finds C++ line comments (// line_comment), extracts them,
-        and replaces the complete line with a placeholder in the form LINECOMMENT000000 .
+        and replaces them with a placeholder in the form LINECOMMENT000000 .
         The extracted line comments are stored in .line_comments as key value pairs {index:line_comment}.
         index, therein, corresponds to the integer number in LINECOMMENT000000.
 
         Parameters
         ----------
         s_dict : SDict[K, V]
-            dict to be processed. _extract_line_comments() works on dict.line_content
+            dict to be processed. _extract_line_comments() works on dict.block_content
         comments : bool
             If False, line comments will be removed
             (they get replaced by an empty placeholder then, which in effect removes them).
         """
-        for index, line in enumerate(s_dict.line_content):
+        counter = self.counter
+        line_comments = s_dict.line_comments
+
+        def replace_line_comment(match: Match[str]) -> str:
             # if it is a line comment or just a "http://"?
-            if re.search(r"(?<!:)/{2}.*$", line):
-                # if re.search(r'/{2}.*$', line):
-                key = self.counter()
-                # Search for only the FIRST occurrence of '//' in the line.
-                # From there, consider all chars until line ending as ONE comment.
-                line_comment = re.findall("/{2}.*$", line)[0]
-                s_dict.line_comments.update({key: line_comment})
-                placeholder = f"LINECOMMENT{key:06d}"
-                if not comments:
-                    placeholder = ""
-                # Replace line comment with placeholder
-                s_dict.line_content[index] = s_dict.line_content[index].replace(line_comment, placeholder)
+            if not _LINE_COMMENT_START_PATTERN.search(match[0]):
+                return match[0]
+            key = counter()
+            # Consider all chars from the FIRST occurrence of '//' in the line until line ending as ONE comment.
+            line_comments[key] = match["line_comment"]
+            placeholder = f"LINECOMMENT{key:06d}" if comments else ""
+            # Replace line comment with placeholder
+            return match["content"] + placeholder
+
+        # All lines get processed in one single pass over the text block
+        s_dict.block_content = _LINE_COMMENT_PATTERN.sub(replace_line_comment, s_dict.block_content)
 
         return
 
@@ -526,7 +664,7 @@ class NativeParser(Parser):
         self,
         s_dict: SDict[K, V],
     ) -> None:
-        """Find and extract #include directives from dict.line_content, and replace them with Placeholders.
+        """Find and extract #include directives from dict.block_content, and replace them with Placeholders.
 
         Finds #includes directives (#include file), extracts them,
         and replaces the complete line where the include directive was found
@@ -540,41 +678,27 @@ class NativeParser(Parser):
         Parameters
         ----------
         s_dict : SDict[K, V]
-            dict to be processed. _extract_includes() works on dict.line_content
+            dict to be processed. _extract_includes() works on dict.block_content
         """
-        for index, line in enumerate(s_dict.line_content):
-            if re.search(r"^\s*#\s*include", line):
-                ii = self.counter()
-                s_dict.line_content[index] = f"INCLUDE{ii:06d}\n"
+        counter = self.counter
+        includes = s_dict.includes
+        path = s_dict.path
 
-                include_file_name = re.sub(
-                    r"(^\s*#\s*include\s*|\s*$)",
-                    "",
-                    line,
-                )
-                include_file_name = self.remove_quotes_from_string(include_file_name)
-
-                include_file_path = Path.joinpath(s_dict.path, include_file_name)
+        def replace_include(match: Match[str]) -> str:
+            ii = counter()
+            include_directive = match[0]
 
-                include_directive = line
-                if line[-1] == "\n":
-                    include_directive = line[:-1]
+            include_file_name = _INCLUDE_DIRECTIVE_PATTERN.sub("", include_directive)
+            include_file_name = self.remove_quotes_from_string(include_file_name)
 
-                s_dict.includes.update({ii: (include_directive, include_file_name, include_file_path)})
+            include_file_path = Path.joinpath(path, include_file_name)
 
-        return
+            includes[ii] = (include_directive, include_file_name, include_file_path)
+            return f"INCLUDE{ii:06d}"
 
-    def _convert_line_content_to_block_content(
-        self,
-        s_dict: SDict[K, V],
-    ) -> None:
-        """Concatenate all lines from line_content.
+        # All lines get processed in one single pass over the text block
+        s_dict.block_content = _INCLUDE_PATTERN.sub(replace_include, s_dict.block_content)
 
-        Concatenate all lines from line_content to one long string (text block)
-        and store the result in block_content.
-        """
-        s_dict.block_content = "".join(s_dict.line_content)
-        s_dict.line_content.clear()
         return
 
     def _remove_line_endings_from_block_content(
@@ -582,11 +706,7 @@ class NativeParser(Parser):
         s_dict: SDict[K, V],
     ) -> None:
         """Remove all line endings in .block_content and substuitute them by single spaces."""
-        s_dict.block_content = re.sub(
-            r"\n",
-            " ",
-            s_dict.block_content,
-        ).strip()
+        s_dict.block_content = s_dict.block_content.replace("\n", " ").strip()
         return
 
     def _extract_block_comments(
@@ -610,19 +730,22 @@ class NativeParser(Parser):
             If False, block comments will be removed
             (they get replaced by an empty placeholder then, which in effect removes them).
         """
-        block_comments = re.findall(r"/\*[\w\W\d\D\s]*?\*/", s_dict.block_content, re.MULTILINE)
-        s_dict.block_comments = {i: block_comments[i] for i in range(len(block_comments))}
-
-        for key, block_comment in s_dict.block_comments.items():
-            placeholder = f"BLOCKCOMMENT{key:06d}"
-            if not comments:
-                placeholder = ""
+        block_comments: dict[int, str] = {}
+        # Key of the first occurrence, by block comment
+        # (all occurrences of an identical block comment get replaced by the placeholder of its first occurrence)
+        first_keys: dict[str, int] = {}
+
+        def replace_block_comment(match: Match[str]) -> str:
+            block_comment = match[0]
+            key = len(block_comments)
+            block_comments[key] = block_comment
+            key = first_keys.setdefault(block_comment, key)
             # Replace block comment with placeholder
-            s_dict.block_content = re.sub(
-                re.escape(block_comment),
-                placeholder,
-                s_dict.block_content,
-            )
+            return f"BLOCKCOMMENT{key:06d}" if comments else ""
+
+        # All block comments get replaced in one single pass over .block_content
+        s_dict.block_content = _BLOCK_COMMENT_PATTERN.sub(replace_block_comment, s_dict.block_content)
+        s_dict.block_comments = block_comments
 
         return
 
@@ -643,104 +766,65 @@ class NativeParser(Parser):
         s_dict : SDict[K, V]
             dict to be processed. _extract_string_literals() works on dict.block_content.
         """
-        search_pattern: Pattern[str]
-        string_literals: list[str]
-
         # Step 1: Find single quoted string literals in .block_content
-        search_pattern = re.compile(
-            pattern=r"(?P<sq>((?<!\\)\\{8}')|((?<!\\)\\{6}')|((?<!\\)\\{4}')|((?<!\\)\\{2}')|(?<!\\)').*?(?P=sq)",
-            flags=re.MULTILINE,
+        single_quoted_matches: list[Match[str]] = list(
+            _SINGLE_QUOTED_STRING_LITERAL_PATTERN.finditer(s_dict.block_content)
         )
-        single_quoted_matches: list[Match[str]] = list(re.finditer(search_pattern, s_dict.block_content))
 
         # Step 2: Find double quoted string literals in .block_content
         # Double quoted strings are identified as string literals only in case they do not contain a $ character.
         # (double quoted strings containing a $ character are considered expressions, not string literals.)
-        search_pattern = re.compile(
-            pattern=r'(?P<dq>((?<!\\)\\{8}")|((?<!\\)\\{6}")|((?<!\\)\\{4}")|((?<!\\)\\{2}")|(?<!\\)").*?(?P=dq)',
-        )
         double_quoted_matches: list[Match[str]] = []
-        for match in re.finditer(search_pattern, s_dict.block_content):
+        for match in _DOUBLE_QUOTED_STRING_LITERAL_PATTERN.finditer(s_dict.block_content):
             string_literal = match.string[match.start(0) : match.end(0)]
             if "$" not in string_literal:
                 double_quoted_matches.append(match)
 
         # Check for string literals nested inside another string literal
-        dq_start: int
-        sq_start: int
-        sq_end: int
-        # Classify all single quoted string literals as to whether they are (also)
-        # found as a nested literal in any double quoted string literal, or not.
-        _single_quoted_string_literals_found_nested: list[str] = []
-        _single_quoted_string_literals_not_nested: list[str] = []
-        for single_quoted_match in single_quoted_matches:
-            single_quoted_string_literal: str = single_quoted_match.string[
-                single_quoted_match.start(0) : single_quoted_match.end(0)
-            ]
-            dq_start = single_quoted_match.start(0)
-            found_nested_in_double_quoted_match: bool = False
-            for double_quoted_match in double_quoted_matches:
-                sq_start = double_quoted_match.start(0)
-                sq_end = double_quoted_match.end(0)
-                if dq_start > sq_start and dq_start < sq_end:
-                    # sq match is inside dq match -> sq match is nested
-                    found_nested_in_double_quoted_match = True
-                    break
-            if found_nested_in_double_quoted_match:
-                _single_quoted_string_literals_found_nested.append(single_quoted_string_literal)
-            else:
-                _single_quoted_string_literals_not_nested.append(single_quoted_string_literal)
-
-        # Classify all double quoted string literals as to whether they are (also)
-        # found as a nested literal in any single quoted string literal, or not.
-        _double_quoted_string_literals_found_nested: list[str] = []
-        _double_quoted_string_literals_not_nested: list[str] = []
-        for double_quoted_match in double_quoted_matches:
-            double_quoted_string_literal: str = double_quoted_match.string[
-                double_quoted_match.start(0) : double_quoted_match.end(0)
-            ]
-            dq_start = double_quoted_match.start(0)
-            found_nested_in_single_quoted_match: bool = False
-            for single_quoted_match in single_quoted_matches:
-                sq_start = single_quoted_match.start(0)
-                sq_end = single_quoted_match.end(0)
-                if dq_start > sq_start and dq_start < sq_end:
-                    # dq match is inside sq match -> dq match is nested
-                    found_nested_in_single_quoted_match = True
-                    break
-            if found_nested_in_single_quoted_match:
-                _double_quoted_string_literals_found_nested.append(double_quoted_string_literal)
-            else:
-                _double_quoted_string_literals_not_nested.append(double_quoted_string_literal)
-
-        # For replacement of the string literals inside dict.block_content:
-        # Chain the different identified string literals in such a sequence that
-        # outer literals (i.e. those that are NOT found nested inside another literal)
-        # are replaced first.  String literals that were found (also) nested inside other literals
-        # are replaced last. The latter then would only replace occurences of these string literals
-        # where they are NOT nested (as the nested occurences are already replaced by
-        # the placeholders of the outer string literals they were nested in).
-        string_literals = (
-            _single_quoted_string_literals_not_nested
-            + _double_quoted_string_literals_not_nested
-            + _single_quoted_string_literals_found_nested
-            + _double_quoted_string_literals_found_nested
-        )
-        for string_literal in string_literals:
-            index = self.counter()
-            placeholder = f"STRINGLITERAL{index:06d}"
-
-            # Replace all occurances of the string literal in .block_content with the placeholder (STRINGLITERAL000000)
-            # Note: For re.sub() to work properly we need to escape all special characters
-            search_pattern = re.compile(re.escape(string_literal))
-            s_dict.block_content = re.sub(
-                search_pattern,
-                placeholder,
-                s_dict.block_content,
-            )
+        # Note: The matches of each kind do not overlap and are sorted by their position in .block_content.
+        #       Whether a match starts inside a match of the other kind can hence be looked up by bisection,
+        #       instead of comparing it with all matches of the other kind.
+        def is_nested(start: int, starts: list[int], ends: list[int]) -> bool:
+            # Last match of the other kind starting before start (if any)
+            index = bisect_left(starts, start) - 1
+            return index >= 0 and start < ends[index]
+
+        # Collect all single quoted string literals that are not found nested in any double quoted string literal.
+        dq_starts: list[int] = [match.start(0) for match in double_quoted_matches]
+        dq_ends: list[int] = [match.end(0) for match in double_quoted_matches]
+        single_quoted_matches_not_nested: list[Match[str]] = [
+            match for match in single_quoted_matches if not is_nested(match.start(0), dq_starts, dq_ends)
+        ]
+
+        # Collect all double quoted string literals that are not found nested in any single quoted string literal.
+        sq_starts: list[int] = [match.start(0) for match in single_quoted_matches]
+        sq_ends: list[int] = [match.end(0) for match in single_quoted_matches]
+        double_quoted_matches_not_nested: list[Match[str]] = [
+            match for match in double_quoted_matches if not is_nested(match.start(0), sq_starts, sq_ends)
+        ]
 
+        # Replace the string literals inside dict.block_content with placeholders (STRINGLITERAL000000):
+        # Only outer literals (i.e. those that are NOT found nested inside another literal) are replaced.
+        # Literals nested inside an outer literal get replaced as part of the outer literal they are nested in.
+        # Note: Outer literals do not overlap. Hence, .block_content can be rebuilt in one single pass,
+        #       by joining the slices between the outer literals and the placeholders substituting them.
+        replacements: list[tuple[int, int, str]] = []
+        for match in single_quoted_matches_not_nested + double_quoted_matches_not_nested:
+            index = self.counter()
+            replacements.append((match.start(0), match.end(0), f"STRINGLITERAL{index:06d}"))
             # Register the string literal in .string_literals
-            s_dict.string_literals.update({index: Parser.remove_quotes_from_string(string_literal)})
+            s_dict.string_literals[index] = Parser.remove_quotes_from_string(match[0])
+        replacements.sort()
+
+        block_content = s_dict.block_content
+        parts: list[str] = []
+        position: int = 0
+        for start, end, placeholder in replacements:
+            parts.append(block_content[position:start])
+            parts.append(placeholder)
+            position = end
+        parts.append(block_content[position:])
+        s_dict.block_content = "".join(parts)
 
         return
 
@@ -769,41 +853,29 @@ class NativeParser(Parser):
         # Expressions are double quoted strings that contain minimum one reference.
         # References are denoted using the '$' syntax familiar from shell programming.
         # Any key'd entries in a dict are considered variables and can be referenced.
-        search_pattern: str | Pattern[str] = r'"[^"]*\$.*?"'
-        expressions = re.findall(search_pattern, s_dict.block_content, re.MULTILINE)
-        for expression in expressions:
+        def replace_expression(match: Match[str]) -> str:
             index = self.counter()
             placeholder = f"EXPRESSION{index:06d}"
-
-            # Replace all occurances of the expression in .block_content with the placeholder (EXPRESSION000000)
-            # Note: For re.sub() to work properly we need to escape all special characters
-            # (covering both '$' as well as any mathematical operators in the expression)
-            search_pattern = re.compile(re.escape(expression))
-            # replace expression in .block_content with placeholder
-            s_dict.block_content = re.sub(
-                search_pattern,
-                placeholder,
-                s_dict.block_content,
-            )
-
             # Register the expression in .expressions
-            _expression = re.sub(
-                r"\"",
-                "",
-                expression,
-            )
-            s_dict.expressions |= {index: {"expression": _expression, "name": placeholder}}
+            s_dict.expressions[index] = {"expression": match[0].replace('"', ""), "name": placeholder}
+            # Replace the expression with the placeholder (EXPRESSION000000)
+            return placeholder
+
+        # All expressions get replaced in one single pass over .block_content
+        s_dict.block_content = _EXPRESSION_PATTERN.sub(replace_expression, s_dict.block_content)
 
         # Step 2: Find references in .block_content (single references to key'd entries that are NOT in double quotes).
-        search_pattern = r"\$\w[\w\[\]]*"
-        while match := re.search(search_pattern, s_dict.block_content, re.MULTILINE):
-            reference = match[0]
+        def replace_reference(match: Match[str]) -> str:
             index = self.counter()
             placeholder = f"EXPRESSION{index:06d}"
-            # Replace the found reference in .block_content with the placeholder (EXPRESSION000000)
-            s_dict.block_content = match.re.sub(placeholder, s_dict.block_content, count=1)
             # Register the reference as expression in .expressions
-            s_dict.expressions.update({index: {"expression": reference, "name": placeholder}})
+            s_dict.expressions[index] = {"expression": match[0], "name": placeholder}
+            # Replace the reference with the placeholder (EXPRESSION000000)
+            return placeholder
+
+        # All references get replaced in one single pass over .block_content
+        s_dict.block_content = _REFERENCE_PATTERN.sub(replace_reference, s_dict.block_content)
+
         return
 
     def _separate_delimiters(
@@ -822,30 +894,24 @@ class NativeParser(Parser):
         - single spaces
 
         Hence, calling _separate_delimiters() is a preparatory step before
-        decomposing .block_content into a list of tokens with re.split('\\s').
-        It ensures that re.split('\\s') generates tokens containing one single word each (or a single char delimiter)
+        decomposing .block_content into a list of tokens with str.split(' ').
+        It ensures that str.split(' ') generates tokens containing one single word each (or a single char delimiter)
         but not any 'waste' tokens with spaces, tabs or line endings will be deleted.
         """
         if delimiters is None:
             delimiters = s_dict.delimiters
 
         # Insert at least one \s around every char in list
-        for char in delimiters:
-            s_dict.block_content = re.sub(
-                str(rf"(\{char})"),
-                str(f" {char} "),
-                s_dict.block_content,
-            )
+        # Note: All delimiters are single characters. They can hence be padded in one single pass using str.translate(),
+        #       instead of substituting them one by one.
+        translation_table = str.maketrans({char: f" {char} " for char in delimiters})
+        s_dict.block_content = s_dict.block_content.translate(translation_table)
 
         # Substitute all \s+ to \s
         # This turns multiple spaces into one single space.
         # However, as \s+ matches ANY whitespace character (\s+ is equivalent to [ \t\n\r\f\v]+)
         # this also deletes all line endings (\n). As explained above, this is well intended though.
-        s_dict.block_content = re.sub(
-            r"\s+",
-            " ",
-            s_dict.block_content,
-        )
+        s_dict.block_content = _WHITESPACES_PATTERN.sub(" ", s_dict.block_content)
 
         return
 
@@ -854,7 +920,9 @@ class NativeParser(Parser):
         s_dict: SDict[K, V],
     ) -> None:
         """Decomposes .block_content into a list of tokens."""
-        s_dict.tokens = [(0, i) for i in re.split(r"\s", s_dict.block_content)]
+        # Note: _separate_delimiters() has reduced all whitespace in .block_content to single spaces.
+        #       Splitting at single spaces is hence sufficient, and no regex is needed.
+        s_dict.tokens = [(0, i) for i in s_dict.block_content.split(" ")]
         s_dict.block_content = ""
 
         return
@@ -865,29 +933,27 @@ class NativeParser(Parser):
     ) -> None:
         # sourcery skip: use-join
         """Create the hierarchy among the tokens and test their indentation."""
+        opening_brackets: frozenset[str] = frozenset(s_dict.openingBrackets)
+        closing_brackets: frozenset[str] = frozenset(s_dict.closingBrackets)
         level = 0
-        count_open: list[str] = []
-        count_close: list[str] = []
-        for index, item in enumerate(s_dict.tokens):
-            if item[1] in s_dict.openingBrackets:
-                push_pop = 1
-                count_open.append(item[1])
-            elif item[1] in s_dict.closingBrackets:
-                push_pop = -1
-                count_close.append(item[1])
+        count_open: Counter[str] = Counter()
+        count_close: Counter[str] = Counter()
+        # Create the leveled tokens in one pass, and then swap them in as a whole (instead of token by token).
+        # Note: An opening bracket is on the same level as the tokens preceeding it. The tokens following it are
+        #       one level deeper. A closing bracket is on the same level as the opening bracket it belongs to.
+        tokens: list[tuple[int, str]] = []
+        for _, token in s_dict.tokens:
+            if token in opening_brackets:
+                count_open[token] += 1
+                tokens.append((level, token))
+                level += 1
+            elif token in closing_brackets:
+                count_close[token] += 1
+                level -= 1
+                tokens.append((level, token))
             else:
-                push_pop = 0
-
-            if push_pop < 0:
-                level += push_pop
-                push_pop = 0
-
-            # if not re.search('COMMENT', self.tokens[index][1]):
-            s_dict.tokens[index] = (level, s_dict.tokens[index][1])
-
-            if push_pop > 0:
-                level += push_pop
-                push_pop = 0
+                tokens.append((level, token))
+        s_dict.tokens[:] = tokens
 
         if level != 0:
             counted = ""
@@ -896,9 +962,9 @@ class NativeParser(Parser):
                     [
                         "\t\t\t",
                         opening_bracket,
-                        str(len([b for b in count_open if b == opening_bracket])),
+                        str(count_open[opening_bracket]),
                         " -- ",
-                        str(len([b for b in count_close if b == closing_bracket])),
+                        str(count_close[closing_bracket]),
                         closing_bracket,
                         "\n",
                     ]
@@ -915,7 +981,14 @@ class NativeParser(Parser):
         s_dict: SDict[K, V],
     ) -> None:
         """Convert the hierarchic tokens into a dict."""
-        s_dict.update(self._parse_tokenized_dict(s_dict))
+        # The bracket lookups are created only once here, and then get passed down to all (recursive) parse calls.
+        s_dict.update(
+            self._parse_tokenized_dict(
+                s_dict,
+                opening_brackets=frozenset(s_dict.openingBrackets),
+                companion_brackets=dict(s_dict.brackets),
+            )
+        )
         s_dict.tokens.clear()
 
         return
@@ -925,6 +998,10 @@ class NativeParser(Parser):
         s_dict: SDict[K, V],
         tokens: list[tuple[int, str]] | None = None,
         level: int = 0,
+        start: int = 0,
+        stop: int | None = None,
+        opening_brackets: frozenset[str] | None = None,
+        companion_brackets: dict[str, str] | None = None,
     ) -> dict[K, V]:
         """Parse a tokenized dict and return the parsed dict.
 
@@ -938,6 +1015,12 @@ class NativeParser(Parser):
 
         After all tokens have successfully been parsed, return the parsed dict.
 
+        Only the tokens in tokens[start:stop] are parsed. Nested data structs are parsed by recursive calls
+        that get passed the start and stop index of the nested data struct's tokens,
+        instead of a copy of these tokens.
+        Likewise, the set of opening brackets and the companion (closing) bracket of each opening bracket
+        are created only once and then passed down to the recursive calls.
+
         Note: To allow recursive calls in case of nested dicts, parsed_dict is declared as a local variable.
         """
         # sourcery skip: remove-redundant-pass
@@ -946,18 +1029,27 @@ class NativeParser(Parser):
 
         if tokens is None:
             tokens = s_dict.tokens
+        if stop is None:
+            stop = len(tokens)
+
+        # Opening brackets as set, for constant time membership tests inside the loop
+        if opening_brackets is None:
+            opening_brackets = frozenset(s_dict.openingBrackets)
+        # Companion (closing) bracket of each opening bracket, for constant time lookup inside the loop
+        if companion_brackets is None:
+            companion_brackets = dict(s_dict.brackets)
 
         # Iterate through tokens
-        last_index: int | None = None
-        token_index: int = 0
+        token_index: int = start
         key: K  # key (name) of the data struct
-        while token_index < len(tokens):
+        while token_index < stop:
+            symbol: str = tokens[token_index][1]
             # Nested data struct (list or dict)   '(' = list    '{' = dict
-            if tokens[token_index][1] in s_dict.openingBrackets:
+            if symbol in opening_brackets:
                 # The key (name) of the data struct is by convention directly preceeding the opening bracket.
                 # ..except if there are line comments in between. skip those:
                 offset: int = 1
-                while re.match("^.*COMMENT.*$", str(tokens[token_index - offset][1])):
+                while "COMMENT" in tokens[token_index - offset][1]:
                     offset += 1
                 # key (name) of the data struct:
                 key = cast(K, self.parse_key(tokens[token_index - offset][1]))
@@ -965,64 +1057,43 @@ class NativeParser(Parser):
                 # Closing bracket has by definition same level as opening bracket.
                 # (Note: the tokens BETWEEN the brackets are considered one level 'deeper';
                 #  but that's not the point here)
-                closing_bracket: str = self._find_companion(s_dict, tokens[token_index][1])
+                closing_bracket: str = companion_brackets.get(symbol, "")
                 closing_level: int = tokens[token_index][0]
 
-                # Create a temporary data_struct_tokens list for just the nested data struct, containing
-                # all tokens from the opening bracket (first token) to the closing bracket (last token)
-                data_struct_tokens: list[tuple[int, str]] = []
-                i: int = 0
-                last_index = None
-                # Start at opening bracket, go forward and copy the tokens
-                # until (and including) the accompanied closing bracket.
-                while tokens[token_index + i][1] != closing_bracket or (
-                    tokens[token_index + i][0] != closing_level
-                    and not re.match(
-                        pattern="^.*COMMENT.*$",
-                        string=str(tokens[token_index + i][1]),
-                    )
-                ):
-                    last_index = token_index + i
-                    data_struct_tokens.append(tokens[token_index + i])
-                    i += 1
-                data_struct_tokens.append(tokens[token_index + i])
+                # Find the index of the closing bracket. The tokens of the nested data struct then range
+                # from the opening bracket (token_index) to the closing bracket (closing_index)
+                closing_index: int = self._find_closing_bracket(tokens, token_index, closing_bracket, closing_level)
 
                 # Do a Syntax-Check at the closing bracket of the data struct.
                 # As the syntax for lists and dicts is different, the syntax check is type specific:
                 # list:
                 # Proof that list properly ends with ';'
                 # (= assert that closing bracket of the list is followed by ';')
-                if data_struct_tokens[-1][1] == ")" and tokens[token_index + i + 1][1] not in [";", ")"]:
+                if tokens[closing_index][1] == ")" and tokens[closing_index + 1][1] not in [";", ")"]:
                     # log error: Missing ';' after list
-                    logger.warning(
-                        "mis-spelled expression / missing ';' around \""
-                        f"{' '.join([str(key)] + [t[1] for t in data_struct_tokens] + [tokens[token_index + i + 1][1]])}"  # noqa: E501
-                        "\""
-                    )
+                    data_struct = " ".join(t[1] for t in tokens[token_index : closing_index + 2])
+                    logger.warning(f"mis-spelled expression / missing ';' around \"{key!s} {data_struct}\"")
                 # dict:
-                if data_struct_tokens[-1][1] == "}":
+                if tokens[closing_index][1] == "}":
                     # Proof that last key value pair in dict ends with ';'
                     # (= assert that second-to-last token is ';')
-                    index: int = -2
+                    index: int = closing_index - 1
                     # ..ok, line comments do not count .. skip them:
-                    while re.match("^.*COMMENT.*$", str(data_struct_tokens[index][1])):
+                    while "COMMENT" in tokens[index][1]:
                         index -= 1
                     # ..but now: Does the last key value pair end with ';'?
-                    if data_struct_tokens[index][1] not in ["{", ";", "}"]:
+                    if tokens[index][1] not in ["{", ";", "}"]:
                         # log error: Missing ';' after key value pair
-                        logger.error(
-                            "mis-spelled expression / missing ';' around \""
-                            f"{' '.join([str(key)] + [t[1] for t in data_struct_tokens])}"
-                            "\""
-                        )
+                        data_struct = " ".join(t[1] for t in tokens[token_index : closing_index + 1])
+                        logger.error(f"mis-spelled expression / missing ';' around \"{key!s} {data_struct}\"")
 
                 # Parse the tokenized data struct, translate it into its type (list or dict),
                 # and update parsed_dict with the new list or dict.
                 # Again, the code is type specific depending on whether the parsed data struct is a list or a dict.
                 # list:
-                if data_struct_tokens[0][1] == "(":
+                if tokens[token_index][1] == "(":
                     # Check whether the list is empty
-                    if len(data_struct_tokens) < 3:  # noqa: PLR2004
+                    if closing_index - token_index < 2:  # noqa: PLR2004
                         # is empty (contains only opening and closing bracket)
                         # update parsed_dict with just the empty list
                         parsed_dict[key] = cast(V, [])
@@ -1031,19 +1102,27 @@ class NativeParser(Parser):
                         # parse the nested list
                         nested_list = self._parse_tokenized_list(
                             s_dict=s_dict,
-                            tokens=data_struct_tokens,
+                            tokens=tokens,
                             level=level + 1,
+                            start=token_index,
+                            stop=closing_index + 1,
+                            opening_brackets=opening_brackets,
+                            companion_brackets=companion_brackets,
                         )
                         # update parsed_dict with the nested list
                         parsed_dict[key] = cast(V, nested_list)
 
                 #  dict:
-                elif data_struct_tokens[0][1] == "{":
+                elif tokens[token_index][1] == "{":
                     # parse the nested dict (recursion)
                     nested_dict = self._parse_tokenized_dict(
                         s_dict=s_dict,
-                        tokens=data_struct_tokens[1:-1],
+                        tokens=tokens,
                         level=level + 1,
+                        start=token_index + 1,
+                        stop=closing_index,
+                        opening_brackets=opening_brackets,
+                        companion_brackets=companion_brackets,
                     )
                     # update parsed_dict with the nested dict
                     parsed_dict[key] = cast(V, nested_dict)
@@ -1052,23 +1131,21 @@ class NativeParser(Parser):
                 # and local parsed_dict is updated.
                 # To close out and move on, fast-forward the index of tokens
                 # to 'after' the data struct we just parsed:
-                if last_index is not None:
-                    token_index = last_index + 1
+                token_index = closing_index
 
-            elif tokens[token_index][1] == ";" and tokens[token_index - 1][1] != ")":
+            elif symbol == ";" and tokens[token_index - 1][1] != ")":
                 # Read the key (name) and the value from the key value pair
                 # Parse from right to left, starting at the identified ';'
                 # and then copy the tokens into a temporary key_value_pair_tokens list:
                 key_value_pair_tokens: MutableSequence[tuple[int, str]] = [tokens[token_index]]  # ';'
                 key_value_pair_token_level: int = tokens[token_index][0]
                 i = 1
-                last_index = None
                 while (
-                    token_index - i >= 0
+                    token_index - i >= start
                     and tokens[token_index - i][0] == key_value_pair_token_level
                     and tokens[token_index - i][1] not in [";", "}"]
-                    and not re.match(r"^.*COMMENT.*$", str(tokens[token_index - i][1]))
-                    and not re.match(r"^.*INCLUDE.*$", str(tokens[token_index - i][1]))
+                    and "COMMENT" not in tokens[token_index - i][1]
+                    and "INCLUDE" not in tokens[token_index - i][1]
                 ):
                     key_value_pair_tokens.append(tokens[token_index - i])
                     i += 1
@@ -1084,8 +1161,8 @@ class NativeParser(Parser):
                     or len(key_value_pair_tokens[1]) != 2  # noqa: PLR2004
                 ):
                     # Something is lexically wrong.  Not a valid key-value pair. -> Skip and log warning
-                    context_tokens_index_from = max(0, token_index - 20)
-                    context_tokens_index_to = min(token_index + 20, len(tokens))
+                    context_tokens_index_from = max(start, token_index - 20)
+                    context_tokens_index_to = min(token_index + 20, stop)
                     context = (
                         "/"
                         + " ".join(
@@ -1124,10 +1201,8 @@ class NativeParser(Parser):
                         logger.error(f"unexpected type of key 'name': int (value: {key}).")
                     parsed_dict[key] = value
 
-            elif re.match("^.*COMMENT.*$", str(tokens[token_index][1])) or re.match(
-                "^.*INCLUDE.*$", str(tokens[token_index][1])
-            ):
-                parsed_dict[cast(K, tokens[token_index][1])] = cast(V, tokens[token_index][1])
+            elif "COMMENT" in symbol or "INCLUDE" in symbol:
+                parsed_dict[cast(K, symbol)] = cast(V, symbol)
 
             else:
                 pass
@@ -1143,6 +1218,10 @@ class NativeParser(Parser):
         s_dict: SDict[K, V],
         tokens: list[tuple[int, str]] | None = None,
         level: int = 0,
+        start: int = 0,
+        stop: int | None = None,
+        opening_brackets: frozenset[str] | None = None,
+        companion_brackets: dict[str, str] | None = None,
     ) -> list[V]:
         """Parse a tokenized list and return the parsed list.
 
@@ -1155,6 +1234,12 @@ class NativeParser(Parser):
 
         After all tokens have successfully been parsed, return the parsed list.
 
+        Only the tokens in tokens[start:stop] are parsed. Nested data structs are parsed by recursive calls
+        that get passed the start and stop index of the nested data struct's tokens,
+        instead of a copy of these tokens.
+        Likewise, the set of opening brackets and the companion (closing) bracket of each opening bracket
+        are created only once and then passed down to the recursive calls.
+
         Note: To allow recursive calls in case of nested lists, parsed_list is declared as a local variable.
         """
         # sourcery skip: remove-empty-nested-block, remove-redundant-if, remove-redundant-pass
@@ -1163,72 +1248,63 @@ class NativeParser(Parser):
 
         if tokens is None:
             tokens = s_dict.tokens
+        if stop is None:
+            stop = len(tokens)
+
+        # Opening brackets as set, for constant time membership tests inside the loop
+        if opening_brackets is None:
+            opening_brackets = frozenset(s_dict.openingBrackets)
+        # Companion (closing) bracket of each opening bracket, for constant time lookup inside the loop
+        if companion_brackets is None:
+            companion_brackets = dict(s_dict.brackets)
 
         # Iterate through tokens
-        base_level: int = tokens[0][0]
-        token_index: int = 0
-        last_index: int | None = None
-        while token_index < len(tokens):
+        base_level: int = tokens[start][0]
+        token_index: int = start
+        while token_index < stop:
+            symbol: str = tokens[token_index][1]
             # Nested data struct (list or dict)   '(' = list    '{' = dict
-            if tokens[token_index][1] in s_dict.openingBrackets and tokens[token_index][0] > base_level:
+            if symbol in opening_brackets and tokens[token_index][0] > base_level:
                 # Closing bracket has by definition same level as opening bracket.
                 # (Note: the tokens BETWEEN the brackets are considered one level 'deeper';
                 #  but that's not the point here)
-                closing_bracket: str = self._find_companion(s_dict, tokens[token_index][1])
+                closing_bracket: str = companion_brackets.get(symbol, "")
                 closing_level: int = tokens[token_index][0]
 
-                # Create a temporary token list for just the nested data struct, containing
-                # all tokens from the opening bracket (first token) to the closing bracket (last token)
-                temp_tokens: list[tuple[int, str]] = []
-                i: int = 0
-                last_index = None
-                # Start at opening bracket, go forward and copy the tokens
-                # until (and including) the accompanied closing bracket
-                while tokens[token_index + i][1] != closing_bracket or (
-                    tokens[token_index + i][0] != closing_level
-                    and not re.match(
-                        pattern="^.*COMMENT.*$",
-                        string=str(tokens[token_index + i][1]),
-                    )
-                ):
-                    last_index = token_index + i
-                    temp_tokens.append(tokens[token_index + i])
-                    i += 1
-                temp_tokens.append(tokens[token_index + i])
+                # Find the index of the closing bracket. The tokens of the nested data struct then range
+                # from the opening bracket (token_index) to the closing bracket (closing_index)
+                closing_index: int = self._find_closing_bracket(tokens, token_index, closing_bracket, closing_level)
 
                 # Do a Syntax-Check at the closing bracket of the data struct.
                 # As the syntax for lists and dicts is different, the syntax check is type specific:
                 # list:
-                if temp_tokens[-1][1] == ")":
+                if tokens[closing_index][1] == ")":
                     # nothing to proof.  A list nested inside a list simply ends with ')'.
                     # Note: This is different for a list nested inside a dict: Then, the closing
                     # bracket of the list must be followed by ';' (because, basically, the list is then the 'value'
                     # part of a key value pair inside the dict. And key value pairs syntactically close with ';')
                     pass
                 # dict:
-                if temp_tokens[-1][1] == "}":
+                if tokens[closing_index][1] == "}":
                     # Proof that last key value pair in dict ends with ';'
                     # (= assert that second-to-last token is ';')
-                    index: int = -2
+                    index: int = closing_index - 1
                     # ..ok, line comments do not count .. skip them:
-                    while re.match("^.*COMMENT.*$", str(temp_tokens[index][1])):
+                    while "COMMENT" in tokens[index][1]:
                         index -= 1
                     # ..but now: Does the last key value pair end with ';'?
-                    if temp_tokens[index][1] not in ["{", ";", "}"]:
+                    if tokens[index][1] not in ["{", ";", "}"]:
                         # log error: Missing ';' after key value pair
-                        logger.error(
-                            "mis-spelled expression / missing ';' around \""
-                            f"{' '.join([t[1] for t in temp_tokens])}"
-                            "\""
-                        )
+                        data_struct = " ".join(t[1] for t in tokens[token_index : closing_index + 1])
+                        logger.error(f"mis-spelled expression / missing ';' around \"{data_struct}\"")
 
                 # Parse the tokenized data struct, translate it into its type (list or dict),
                 # and update parsed_list with the new list or dict.
                 # Again, the code is type specific depending on whether the parsed data struct is a list or a dict.
                 # list:
-                if temp_tokens[0][1] == "(":
+                if tokens[token_index][1] == "(":
                     # Check whether the list is empty
-                    if len(temp_tokens) < 3:  # noqa: PLR2004
+                    if closing_index - token_index < 2:  # noqa: PLR2004
                         # list is empty (contains only the opening and the closing bracket)
                         # -> add an empty list to parsed_list
                         parsed_list.append(cast(V, []))
@@ -1236,18 +1312,26 @@ class NativeParser(Parser):
                         # parse the nested list
                         nested_list = self._parse_tokenized_list(  # (recursion)
                             s_dict=s_dict,
-                            tokens=temp_tokens,
+                            tokens=tokens,
                             level=level + 1,
+                            start=token_index,
+                            stop=closing_index + 1,
+                            opening_brackets=opening_brackets,
+                            companion_brackets=companion_brackets,
                         )
                         # add nested list to parsed_list
                         parsed_list.append(cast(V, nested_list))
                         #  dict:
-                elif temp_tokens[0][1] == "{":
+                elif tokens[token_index][1] == "{":
                     # parse the nested dict
                     nested_dict = self._parse_tokenized_dict(
                         s_dict=s_dict,
-                        tokens=temp_tokens[1:-1],
+                        tokens=tokens,
                         level=level + 1,
+                        start=token_index + 1,
+                        stop=closing_index,
+                        opening_brackets=opening_brackets,
+                        companion_brackets=companion_brackets,
                     )
                     # add nested dict to parsed_list
                     parsed_list.append(cast(V, nested_dict))
@@ -1256,12 +1340,11 @@ class NativeParser(Parser):
                 # and local parsed_list is updated.
                 # To close out and move on, fast-forward the index of tokens
                 # to 'after' the data struct we just parsed:
-                if last_index is not None:
-                    token_index = last_index + 1
+                token_index = closing_index
 
             # Single value type
-            elif tokens[token_index][1] not in ["(", ")", ";"]:
-                value = cast(V, self.parse_value(tokens[token_index][1]))
+            elif symbol not in ("(", ")", ";"):
+                value = cast(V, self.parse_value(symbol))
                 parsed_list.append(value)
 
             # -else = ';' or ')'
@@ -1274,44 +1357,66 @@ class NativeParser(Parser):
         # Return the parsed list
         return parsed_list
 
-    def _find_companion(
+    def _find_closing_bracket(
         self,
-        s_dict: SDict[K, V],
-        bracket: str,
-    ) -> str:
-        """Return the companion bracket character for the passed in bracket character.
-
-        Example: If you pass in '{', _find_companion() will return '}'  (and vice versa)
+        tokens: list[tuple[int, str]],
+        opening_index: int,
+        closing_bracket: str,
+        closing_level: int,
+    ) -> int:
+        """Return the index of the closing bracket that accompanies the opening bracket at opening_index.
+
+        Starts at the opening bracket and goes forward until the accompanied closing bracket is found.
+        Only the index is searched for, so that the tokens of the data struct can then be copied in one single slice.
         """
-        companion = ""
-        for item in s_dict.brackets:
-            if bracket == item[0]:
-                companion = item[1]
-            elif bracket == item[1]:
-                companion = item[0]
-        return companion
+        index: int = opening_index
+        while tokens[index][1] != closing_bracket or (
+            tokens[index][0] != closing_level and "COMMENT" not in tokens[index][1]
+        ):
+            index += 1
+        return index
 
     def _insert_string_literals(
         self,
         s_dict: SDict[K, V],
     ) -> None:
         """Substitutes STRINGLITERAL placeholders in the dict with the corresponding entry from dict.string_literals."""
-        for index, string_literal in s_dict.string_literals.items():
-            # Properties of the expression to be evaluated
-            placeholder = f"STRINGLITERAL{index:06d}"  # STRINGLITERAL000000
-            # The entry from dict.string_literals is parsed once again,
-            # so that entries representing single value native types
-            # (such as bool ,None, int, float) are transformed to its native type, accordingly.
-            value = cast(V, self.parse_value(string_literal))
-
-            # Replace all occurences of placeholder within the dictionary with the original string literal.
-            # Note: As find_global_key() is non-greedy and returns the key of
-            # only the first occurance of placeholder it finds,
-            # we need to loop until we found and replaced all occurances of placholder in the dict
-            # and find_global_key() does not find any more occurances.
-            while global_key := s_dict.find_global_key(query=placeholder):
-                # Back insert the string literal
-                s_dict.set_global_key(global_key, value)
+        # The entries from dict.string_literals are parsed once again,
+        # so that entries representing single value native types
+        # (such as bool ,None, int, float) are transformed to its native type, accordingly.
+        values: dict[str, V] = {
+            f"STRINGLITERAL{index:06d}": cast(V, self.parse_value(string_literal))  # STRINGLITERAL000000
+            for index, string_literal in s_dict.string_literals.items()
+        }
+
+        def find_placeholder(item: Any) -> str | None:  # noqa: ANN401
+            # A value containing a placeholder gets replaced as a whole by the string literal.
+            # Should a value contain more than one placeholder, the string literal with the lowest index wins.
+            if not values or not isinstance(item, str) or "STRINGLITERAL" not in item:
+                return None
+            placeholders = [p for p in _STRING_LITERAL_PLACEHOLDER_PATTERN.findall(item) if p in values]
+            return min(placeholders) if placeholders else None
+
+        # Replace all occurences of the placeholders within the dictionary with the original string literals,
+        # in one single traversal of the dictionary (instead of searching the dictionary for each placeholder).
+        # Nested dicts and lists are processed iteratively, by adding them to this stack (instead of by recursion).
+        containers: list[MutableMapping[K, V] | MutableSequence[V]] = [s_dict]
+        while containers:
+            container = containers.pop()
+            if isinstance(container, MutableMapping):  # Dict
+                for key, item in container.items():
+                    if isinstance(item, _CONTAINER_TYPES):
+                        containers.append(item)
+                    elif placeholder := find_placeholder(item):
+                        # Back insert the string literal
+                        container[key] = values[placeholder]
+            else:  # List
+                for index, item in enumerate(container):
+                    if isinstance(item, _CONTAINER_TYPES):
+                        containers.append(item)
+                    elif placeholder := find_placeholder(item):
+                        # Back insert the string literal
+                        container[index] = values[placeholder]
         s_dict.string_literals.clear()
         return
 
@@ -1443,7 +1548,7 @@ class JsonParser(Parser):
         keys: list[K] = list(s_dict.keys())
         include_placeholder_keys: dict[K, V] = {}
         for key in keys:
-            if isinstance(key, str) and re.search(r"^\s*#\s*include", key):
+            if isinstance(key, str) and _INCLUDE_KEY_PATTERN.search(key):
                 include_file_name = str(s_dict[cast(K, key)])
                 include_file_name = self.remove_quotes_from_string(include_file_name)
 
@@ -1491,15 +1596,13 @@ class JsonParser(Parser):
         # References are denoted using the '$' syntax familiar from shell programming.
         # Any key'd entries in a dict are considered variables and can be referenced.
         # If string does not contain minimum one reference, return.
-        search_pattern: str | Pattern[str] = r"\$\w[\w\[\]]*"
-        references = re.findall(search_pattern, string, re.MULTILINE)
+        references = _REFERENCE_PATTERN.findall(string)
         if not references:
             return string
 
         # Case 1: Reference
         # The string contains only a single plain reference (single reference to a key'd entry in the parsed dict).
-        search_pattern = r"^\s*(\$\w[\w\[\]]*){1}\s*$"
-        if match := re.search(search_pattern, string, re.MULTILINE):
+        if match := _SINGLE_REFERENCE_PATTERN.search(string):
             reference: str = match.groups()[0]
             # Replace the reference in string with a placeholder (EXPRESSION000000) and register it in parsed_dict:
             return self._replace_and_register_expression(parsed_dict, string, reference)
@@ -1540,14 +1643,9 @@ class JsonParser(Parser):
         """
         index: int = self.counter()
         placeholder: str = f"EXPRESSION{index:06d}"
-        # Note: For re.sub() to work properly we need to escape all special characters
-        #       (covering both '$' as well as any mathematical operators in the expression)
-        _pattern: re.Pattern[str] = re.compile(re.escape(expression))
-        modified_string: str = re.sub(
-            _pattern,
-            placeholder,
-            string,
-        )
+        # Note: The expression is replaced as plain substring. Special characters in the expression
+        #       (such as '$' or any mathematical operators) hence need not be escaped.
+        modified_string: str = string.replace(expression, placeholder)
         # Register the expression in .expressions
         parsed_dict.expressions.update({index: {"expression": expression, "name": placeholder}})
         return modified_string
@@ -1654,14 +1752,7 @@ class XmlParser(Parser):
         # re.sub to fix that temporarily
         # solution needed
         _root_tag: str = str(root_element.tag)
-        root_tag = (
-            re.sub(
-                r"\{.*\}",
-                "",
-                _root_tag,
-            )
-            or root_tag
-        )
+        root_tag = _XML_NAMESPACE_PATTERN.sub("", _root_tag) or root_tag
         # Read namespaces from XML string
         _xml_namespaces: dict[str | None, str] = dict(root_element.nsmap)
         _namespaces = _xml_namespaces or _namespaces
@@ -1714,18 +1805,15 @@ class XmlParser(Parser):
         namespaces: dict[str, str],
     ) -> dict[Any, Any]:
         """Recursively parses all nodes and saves the nodes' content in a dict."""
+        # Child nodes of the root element
+        # Note: The child nodes are searched for only once, and then accessed by index in the loop further below.
+        nodes: Sequence[LxmlElement] = root_element.findall(
+            path="*",
+            namespaces=dict(namespaces),
+        )
+
         # Default case: Make all node tags temporarily unique by indexing them using BorgCounter
-        node_tags: list[str] = [
-            re.sub(
-                pattern=r"^(\{.*\})",
-                repl="",
-                string=str(node.tag),
-            )
-            for node in root_element.findall(
-                path="*",
-                namespaces=dict(namespaces),
-            )
-        ]
+        node_tags: list[str] = [_XML_LEADING_NAMESPACE_PATTERN.sub("", str(node.tag)) for node in nodes]
         indexed_node_tags: list[tuple[str, str]] = []
         node_tag: str
         for node_tag in node_tags:
@@ -1743,17 +1831,8 @@ class XmlParser(Parser):
             if not self.add_node_numbering:
                 # Non-default case: add_node_numbering has been set to False by the caller
                 # -> remove the index again
-                node_tag = re.sub(
-                    pattern=r"^\d{6}_",
-                    repl="",
-                    string=node_tag,
-                )
+                node_tag = _XML_NODE_NUMBERING_PATTERN.sub("", node_tag)
 
-            nodes: Sequence[LxmlElement]
-            nodes = root_element.findall(
-                path="*",
-                namespaces=dict(namespaces),
-            )
             key = self.parse_key(node_tag)
 
             # The recursive part.
@@ -1767,7 +1846,7 @@ class XmlParser(Parser):
                     namespaces=namespaces,
                 )
 
-            elif nodes[index].text is None or re.search(r"^[\s\n\r]*$", nodes[index].text or ""):
+            elif nodes[index].text is None or _XML_EMPTY_TEXT_PATTERN.search(nodes[index].text or ""):
                 # Node has either no content or contains an empty string <NODE ATTRIB=STRING><\NODE>
                 # However, in order to be able to attach attributes to a node,
                 # we still need to create a dict for the node, even if the node has no content.
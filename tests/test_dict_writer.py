@@ -1,11 +1,13 @@
 import re
+from collections.abc import MutableMapping
 from copy import deepcopy
 from pathlib import Path, PurePath
 from typing import Any
 
 import pytest
 
-from dictIO import DictReader, DictWriter, FoamParser, SDict, create_target_file_name
+from dictIO import DictReader, DictWriter, FoamParser, Formatter, NativeFormatter, SDict, create_target_file_name
+from dictIO.types import K, V
 from dictIO.utils.counter import BorgCounter
 
 
@@ -127,6 +129,40 @@ def test_write_mode() -> None:
     target_file.unlink()
 
 
+class _FailingFormatter(NativeFormatter):
+    def to_string(self, arg: MutableMapping[K, V]) -> str:  # noqa: ARG002
+        raise ValueError("formatting failed")
+
+
+@pytest.mark.parametrize(
+    ("target_file_name", "formatter"),
+    [
+        ("parsed.failing_dict.json", None),  # JsonFormatter.to_stream() fails while writing into the stream
+        ("parsed.failing_dict", _FailingFormatter()),  # Formatter.to_stream() fails before writing into the stream
+    ],
+)
+def test_write_failing_serialization_leaves_target_file_unchanged(
+    target_file_name: str,
+    formatter: Formatter | None,
+) -> None:
+    # Prepare
+    target_file = Path(target_file_name)
+    target_file.unlink(missing_ok=True)
+    DictWriter.write({"a": 1}, target_file)
+    previous_content = target_file.read_text()
+    files_before = set(Path.cwd().iterdir())
+    failing_dict: dict[str, Any] = {"a": 1, "b": object()}
+    # Execute and Assert
+    for mode in ("w", "a"):
+        with pytest.raises((TypeError, ValueError)):
+            DictWriter.write(failing_dict, target_file, mode=mode, formatter=formatter)
+        assert target_file.read_text() == previous_content
+        # No temporary file is left behind
+        assert set(Path.cwd().iterdir()) == files_before
+    # Clean up
+    target_file.unlink()
+
+
 @pytest.mark.parametrize("includes", [False, True])
 def test_read_dict_write_dict(
     *,
@@ -1,11 +1,22 @@
+import io
 import re
 from copy import copy, deepcopy
 from pathlib import Path
 from typing import Any
+from xml.etree.ElementTree import register_namespace
 
 import pytest
 
-from dictIO import DictReader, FoamFormatter, Formatter, NativeFormatter, SDict, XmlFormatter
+from dictIO import (
+    DictReader,
+    FoamFormatter,
+    Formatter,
+    JsonFormatter,
+    NativeFormatter,
+    NativeParser,
+    SDict,
+    XmlFormatter,
+)
 
 
 class TestFormatter:
@@ -300,6 +311,20 @@ class TestNativeFormatter:
         # Assert
         assert str_out == str_expected
 
+    def test_insert_line_comments_containing_backslashes(self) -> None:
+        # Prepare
+        s_dict: SDict[str, Any] = SDict()
+        line_comment_in = r"// see C:\path\to\file"
+        s_dict.line_comments = {103: line_comment_in}
+        placeholder = "LINECOMMENT000103            LINECOMMENT000103;"
+        str_in = placeholder + "\n"
+        str_expected = line_comment_in + "\n"
+        formatter = NativeFormatter()
+        # Execute
+        str_out = formatter.insert_line_comments(s_dict, str_in)
+        # Assert
+        assert str_out == str_expected
+
     def test_remove_trailing_spaces(self) -> None:
         # sourcery skip: extract-duplicate-method, move-assign-in-block
         # Prepare
@@ -389,6 +414,20 @@ class TestNativeFormatter:
         # Assert
         assert str_in == str_out
 
+    def test_format_dict_respects_overridden_format_float(self) -> None:
+        # Prepare
+        class CustomFormatter(NativeFormatter):
+            def format_float(self, arg: float) -> str:
+                return f"{arg:.3e}"
+
+        dict_in: dict[str, Any] = {"value": 1.5, "values": [0.5, 2]}
+        formatter = CustomFormatter()
+        # Execute
+        str_out: str = formatter.format_dict(dict_in)
+        # Assert
+        assert re.search(r"^value\s+1\.500e\+00;$", str_out, re.MULTILINE)
+        assert re.search(r"^\s+5\.000e-01\s+2$", str_out, re.MULTILINE)
+
     def test_to_string_does_not_alter_original(self) -> None:
         # Prepare
         dict_in = DictReader.read(Path("test_formatter_dict"))
@@ -411,6 +450,20 @@ class TestNativeFormatter:
             assert dict_in[key] == dict_in_shallowcopy[key]
             assert dict_in[key] is dict_in_shallowcopy[key]
 
+    @pytest.mark.parametrize("formatter", [NativeFormatter(), FoamFormatter()])
+    def test_parse_format_keeps_repeated_block_comments(self, formatter: NativeFormatter) -> None:
+        # Prepare
+        str_in = "/*---- C++ ----*/\na\n{\n x 1;\n /* note */\n}\nb\n{\n y 2;\n /* note */\n}\n"
+        parser = NativeParser()
+        dict_parsed: SDict[str, Any] = SDict()
+        # Execute
+        dict_parsed = parser.parse_string(str_in, dict_parsed)
+        str_out: str = formatter.to_string(dict_parsed)
+        # Assert
+        # The block comment occurs in both nested dicts, so it must be written back in both of them.
+        assert re.search(r"^a\n\{\n\s+x\s+1;\n\s+/\* note \*/\n\}$", str_out, re.MULTILINE)
+        assert re.search(r"^b\n\{\n\s+y\s+2;\n\s+/\* note \*/\n\}$", str_out, re.MULTILINE)
+
 
 class TestFoamFormatter:
     def test_insert_block_comments(self) -> None:
@@ -521,6 +574,36 @@ class TestFoamFormatter:
             assert dict_in[key] is dict_in_shallowcopy[key]
 
 
+class TestJsonFormatter:
+    def test_default_options(self) -> None:
+        # Execute
+        formatter = JsonFormatter()
+        # Assert
+        assert formatter.sort_keys is False
+
+    def test_to_string_sort_keys(self) -> None:
+        # Prepare
+        dict_in: dict[str, Any] = {"b": 1, "a": {"d": 2, "c": 3}}
+        # Execute
+        str_out_unsorted: str = JsonFormatter().to_string(dict_in)
+        str_out_sorted: str = JsonFormatter(sort_keys=True).to_string(dict_in)
+        # Assert
+        assert str_out_unsorted.index('"b"') < str_out_unsorted.index('"a"')
+        assert str_out_unsorted.index('"d"') < str_out_unsorted.index('"c"')
+        assert str_out_sorted.index('"a"') < str_out_sorted.index('"b"')
+        assert str_out_sorted.index('"c"') < str_out_sorted.index('"d"')
+
+    def test_to_stream_equals_to_string(self) -> None:
+        # Prepare
+        dict_in: dict[str, Any] = {"b": 1, "a": {"d": [2.0, "text"], "c": None}}
+        formatter = JsonFormatter()
+        stream = io.StringIO()
+        # Execute
+        formatter.to_stream(dict_in, stream)
+        # Assert
+        assert stream.getvalue() == formatter.to_string(dict_in)
+
+
 class TestXmlFormatter:
     def test_default_options(self) -> None:
         # Execute
@@ -619,6 +702,38 @@ class TestXmlFormatter:
         assert 'xmlns="https://opensimulationplatform.com/xsd/OspModelDescription"' in str_out
         assert 'xmlns:None="https://opensimulationplatform.com/xsd/OspModelDescription"' not in str_out
 
+    def test_format_xml_namespace_registered_again_with_other_prefix(self) -> None:
+        # Prepare
+        source_file = Path("test_formatter_dict")
+        dict_in = DictReader.read(source_file)
+        uri = "https://opensimulationplatform.com/xsd/OspModelDescription"
+        formatter = XmlFormatter()
+        str_out: list[str] = []
+        # Execute
+        for namespaces in ({"osp": uri}, {"None": uri}, {"osp": uri}):
+            dict_in.update({"_xmlOpts": {"_nameSpaces": namespaces, "_rootTag": "OspModelDescription"}})
+            str_out.append(formatter.to_string(dict_in))
+        # Assert
+        assert f'xmlns:osp="{uri}"' in str_out[0]
+        assert f'xmlns="{uri}"' in str_out[1]
+        assert f'xmlns:osp="{uri}"' in str_out[2]
+        assert str_out[2] == str_out[0]
+
+    def test_format_xml_namespace_registered_elsewhere_with_other_prefix(self) -> None:
+        # Prepare
+        source_file = Path("test_formatter_dict")
+        dict_in = DictReader.read(source_file)
+        uri = "https://opensimulationplatform.com/xsd/OspModelDescription"
+        dict_in.update({"_xmlOpts": {"_nameSpaces": {"osp": uri}, "_rootTag": "OspModelDescription"}})
+        formatter = XmlFormatter()
+        # Execute
+        str_out_before: str = formatter.to_string(dict_in)
+        register_namespace("other", uri)
+        str_out_after: str = formatter.to_string(dict_in)
+        # Assert
+        assert f'xmlns:osp="{uri}"' in str_out_after
+        assert str_out_after == str_out_before
+
     @pytest.mark.skip(reason="XML pretty printing is not solved yet. The root attribute for encoding still gets lost.")
     def test_format_xml_root_attributes(self) -> None:
         # Prepare
@@ -248,6 +248,10 @@ class TestParser:
         float_out = parser.parse_value(str_in)
         assert isinstance(float_out, float)
         assert float_out == 1.0
+        str_in = "-1.e-03"
+        float_out = parser.parse_value(str_in)
+        assert isinstance(float_out, float)
+        assert float_out == -0.001
 
     @pytest.mark.parametrize(
         "str_in, str_expected",
@@ -258,6 +262,12 @@ class TestParser:
             ("", ""),
             ("''", ""),
             ('""', ""),
+            ("'1234'", "1234"),
+            ("inf", "inf"),
+            ("-nan", "-nan"),
+            ("1_000", "1_000"),
+            ("1-3", "1-3"),
+            ("+", "+"),
         ],
     )
     def test_parse_value_str(self, str_in: str, str_expected: str) -> None:
@@ -343,6 +353,29 @@ class TestParser:
         assert target_dict.path == source_file.absolute().parent
         assert target_dict.name == source_file.absolute().name
 
+    def test_parse_files(self) -> None:
+        # Prepare
+        source_files = [Path("test_parser_dict"), Path("test_parser_paramDict"), Path("test_strings_dict")]
+        parser = NativeParser()
+        BorgCounter.reset()
+        dicts_expected: list[SDict[Any, Any]] = [parser.parse_file(source_file) for source_file in source_files]
+        # Execute
+        BorgCounter.reset()
+        dicts = parser.parse_files(source_files)
+        # Assert
+        assert len(dicts) == len(source_files)
+        for parsed_dict, dict_expected, source_file in zip(dicts, dicts_expected, source_files, strict=True):
+            assert parsed_dict.source_file == source_file.absolute()
+            assert parsed_dict == dict_expected
+
+    def test_parse_files_raises_file_not_found(self) -> None:
+        # Prepare
+        source_files = [Path("test_parser_dict"), Path("this_file_does_not_exist")]
+        parser = NativeParser()
+        # Execute and Assert
+        with pytest.raises(FileNotFoundError):
+            _ = parser.parse_files(source_files)
+
 
 class TestNativeParser:
     def test_extract_line_comments(self) -> None:
@@ -354,14 +387,16 @@ class TestNativeParser:
         line2 = "//a line comment\n"
         line3 = "a line with //an inline comment\n"
         line4 = "a line with no line comment\n"
-        s_dict.line_content.extend([line1, line2, line3, line4])
-        assert len(s_dict.line_content) == 4
+        line5 = "a line with http://an.url but no line comment\n"
+        s_dict.block_content = f"{line1}{line2}{line3}{line4}{line5}"
         # Execute
         parser._extract_line_comments(s_dict, comments=True)
         # Assert
-        assert len(s_dict.line_content) == 4
-        for line in s_dict.line_content:
+        lines = s_dict.block_content.splitlines(keepends=True)
+        assert len(lines) == 5
+        for line in lines[:4]:
             assert re.search(r"//", line) is None
+        assert lines[4] == line5
         assert len(s_dict.line_comments) == 2
         for line in s_dict.line_comments.values():
             assert re.search("//", str(line)) is not None
@@ -379,15 +414,15 @@ class TestNativeParser:
         line5 = "   #include testDict   \n"
         line6 = "   # include testDict   \n"
         line7 = "a line with no include directive\n"
-        s_dict.line_content.extend([line1, line2, line3, line4, line5, line6, line7])
-        assert len(s_dict.line_content) == 7
+        s_dict.block_content = f"{line1}{line2}{line3}{line4}{line5}{line6}{line7}"
         file_name_expected = "testDict"
         file_path_expected = Path("testDict").absolute()
         # Execute
         parser._extract_includes(s_dict)
         # Assert
-        assert len(s_dict.line_content) == 7
-        for line in s_dict.line_content:
+        lines = s_dict.block_content.splitlines(keepends=True)
+        assert len(lines) == 7
+        for line in lines:
             assert "#include" not in line
         assert len(s_dict.includes) == 5
         for (
@@ -400,20 +435,6 @@ class TestNativeParser:
             assert include_file_name == file_name_expected
             assert include_file_path == file_path_expected
 
-    def test_convert_line_content_to_block_content(self) -> None:
-        # Prepare
-        s_dict: SDict[str, Any] = SDict()
-        parser = NativeParser()
-        # Three lines with line endings
-        line1 = "line 1\n"
-        line2 = "line 2\n"
-        line3 = "line 3\n"
-        s_dict.line_content.extend([line1, line2, line3])
-        # Execute
-        parser._convert_line_content_to_block_content(s_dict)
-        # Assert
-        assert s_dict.block_content == "line 1\nline 2\nline 3\n"
-
     def test_remove_line_endings_from_block_content(self) -> None:
         # Prepare
         s_dict: SDict[str, Any] = SDict()
@@ -422,8 +443,7 @@ class TestNativeParser:
         line1 = "line 1\n"
         line2 = "line 2\n"
         line3 = "line 3\n"
-        s_dict.line_content.extend([line1, line2, line3])
-        parser._convert_line_content_to_block_content(s_dict)
+        s_dict.block_content = f"{line1}{line2}{line3}"
         # Execute
         parser._remove_line_endings_from_block_content(s_dict)
         # Assert
@@ -752,7 +772,7 @@ class TestNativeParser:
     def test_parse_tokenized_dict(self) -> None:
         # Prepare
         dict_in: SDict[str, Any] = SDict()
-        SetupHelper.prepare_dict_until(dict_to_prepare=dict_in, until_step=9)
+        SetupHelper.prepare_dict_until(dict_to_prepare=dict_in, until_step=8)
         parser = NativeParser()
         # Execute
         dict_out: dict[str, Any] = parser._parse_tokenized_dict(dict_in, dict_in.tokens, level=0)
@@ -779,7 +799,7 @@ class TestNativeParser:
     def test_parse_tokenized_dict_booleans(self) -> None:
         # Prepare
         dict_in: SDict[str, Any] = SDict()
-        SetupHelper.prepare_dict_until(dict_to_prepare=dict_in, until_step=9)
+        SetupHelper.prepare_dict_until(dict_to_prepare=dict_in, until_step=8)
         parser = NativeParser()
         # Execute
         dict_out = parser._parse_tokenized_dict(dict_in, dict_in.tokens, level=0)
@@ -805,7 +825,7 @@ class TestNativeParser:
     def test_parse_tokenized_dict_numbers(self) -> None:
         # Prepare
         dict_in: SDict[str, Any] = SDict()
-        SetupHelper.prepare_dict_until(dict_to_prepare=dict_in, until_step=9)
+        SetupHelper.prepare_dict_until(dict_to_prepare=dict_in, until_step=8)
         parser = NativeParser()
         # Execute
         dict_out = parser._parse_tokenized_dict(dict_in, dict_in.tokens, level=0)
@@ -821,7 +841,7 @@ class TestNativeParser:
     def test_parse_tokenized_dict_nones(self) -> None:
         # Prepare
         dict_in: SDict[str, Any] = SDict()
-        SetupHelper.prepare_dict_until(dict_to_prepare=dict_in, until_step=9)
+        SetupHelper.prepare_dict_until(dict_to_prepare=dict_in, until_step=8)
         parser = NativeParser()
         # Execute
         dict_out = parser._parse_tokenized_dict(dict_in, dict_in.tokens, level=0)
@@ -835,7 +855,7 @@ class TestNativeParser:
     def test_parse_tokenized_dict_strings(self) -> None:
         # Prepare
         dict_in: SDict[str, Any] = SDict()
-        SetupHelper.prepare_dict_until(dict_to_prepare=dict_in, until_step=9)
+        SetupHelper.prepare_dict_until(dict_to_prepare=dict_in, until_step=8)
         parser = NativeParser()
         # Execute
         dict_out = parser._parse_tokenized_dict(dict_in, dict_in.tokens, level=0)
@@ -856,7 +876,7 @@ class TestNativeParser:
     def test_parse_tokenized_dict_invalid(self, caplog: pytest.LogCaptureFixture) -> None:
         # Prepare
         dict_in: SDict[str, Any] = SDict()
-        SetupHelper.prepare_dict_until(dict_to_prepare=dict_in, until_step=9)
+        SetupHelper.prepare_dict_until(dict_to_prepare=dict_in, until_step=8)
         parser = NativeParser()
         log_level_expected = "WARNING"
         log_message_0_expected = (
@@ -882,7 +902,7 @@ class TestNativeParser:
     def test_parse_tokenized_dict_nesting(self) -> None:
         # Prepare
         dict_in: SDict[str, Any] = SDict()
-        SetupHelper.prepare_dict_until(dict_to_prepare=dict_in, until_step=9)
+        SetupHelper.prepare_dict_until(dict_to_prepare=dict_in, until_step=8)
         parser = NativeParser()
         # Execute
         dict_out = parser._parse_tokenized_dict(dict_in, dict_in.tokens, level=0)
@@ -947,7 +967,7 @@ class TestNativeParser:
     def test_parse_tokenized_dict_expressions(self) -> None:
         # Prepare
         dict_in: SDict[str, Any] = SDict()
-        SetupHelper.prepare_dict_until(dict_to_prepare=dict_in, until_step=9)
+        SetupHelper.prepare_dict_until(dict_to_prepare=dict_in, until_step=8)
         parser = NativeParser()
         # Execute
         dict_out = parser._parse_tokenized_dict(dict_in, dict_in.tokens, level=0)
@@ -980,7 +1000,7 @@ class TestNativeParser:
 
         # Prepare
         dict_in: SDict[str, Any] = SDict()
-        SetupHelper.prepare_dict_until(dict_to_prepare=dict_in, until_step=9, comments=False)
+        SetupHelper.prepare_dict_until(dict_to_prepare=dict_in, until_step=8, comments=False)
         parser = NativeParser()
         # Execute
         dict_out = parser._parse_tokenized_dict(dict_in, dict_in.tokens, level=0)
@@ -1016,7 +1036,7 @@ class TestNativeParser:
     def test_insert_string_literals(self) -> None:
         # Prepare
         s_dict: SDict[str, Any] = SDict()
-        SetupHelper.prepare_dict_until(dict_to_prepare=s_dict, until_step=10)
+        SetupHelper.prepare_dict_until(dict_to_prepare=s_dict, until_step=9)
         parser = NativeParser()
         # Execute
         parser._insert_string_literals(s_dict)
@@ -1164,7 +1184,7 @@ class SetupHelper:
 
         with Path.open(source_file) as f:
             file_content = f.read()
-        dict_to_prepare.line_content = file_content.splitlines(keepends=True)
+        dict_to_prepare.block_content = file_content
 
         parser = NativeParser()
 
@@ -1179,44 +1199,40 @@ class SetupHelper:
                 dict_to_prepare,
             ),
             partial(
-                parser._convert_line_content_to_block_content,  # Step 02
-                dict_to_prepare,
-            ),
-            partial(
-                parser._extract_block_comments,  # Step 03
+                parser._extract_block_comments,  # Step 02
                 dict_to_prepare,
                 comments=comments,
             ),
             partial(
-                parser._remove_line_endings_from_block_content,  # Step 04
+                parser._remove_line_endings_from_block_content,  # Step 03
                 dict_to_prepare,
             ),
             partial(
-                parser._extract_string_literals,  # Step 05
+                parser._extract_string_literals,  # Step 04
                 dict_to_prepare,
             ),
             partial(
-                parser._extract_expressions,  # Step 06
+                parser._extract_expressions,  # Step 05
                 dict_to_prepare,
             ),
             partial(
-                parser._separate_delimiters,  # Step 07
+                parser._separate_delimiters,  # Step 06
                 dict_to_prepare,
             ),
             partial(
-                parser._convert_block_content_to_tokens,  # Step 08
+                parser._convert_block_content_to_tokens,  # Step 07
                 dict_to_prepare,
             ),
             partial(
-                parser._determine_token_hierarchy,  # Step 09
+                parser._determine_token_hierarchy,  # Step 08
                 dict_to_prepare,
             ),
             partial(
-                parser._convert_tokens_to_dict,  # Step 10
+                parser._convert_tokens_to_dict,  # Step 09
                 dict_to_prepare,
             ),
             partial(
-                parser._insert_string_literals,  # Step 11
+                parser._insert_string_literals,  # Step 10
                 dict_to_prepare,
             ),
         ]